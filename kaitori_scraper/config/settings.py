@@ -7,10 +7,35 @@ FASTBUY_CATEGORY_ID = 8
 FASTBUY_TOTAL_PAGES = 7
 FASTBUY_REQUEST_DELAY = (2.0, 4.0)
 
+# Concurrent crawl: page fetches are paced by a per-host token bucket instead
+# of serial FASTBUY_REQUEST_DELAY sleeps.
+FASTBUY_CONCURRENT_CRAWL = True
+FASTBUY_RATE_LIMIT = 0.5  # requests/second
+FASTBUY_RATE_BURST = 2
+FASTBUY_MAX_IN_FLIGHT = 2
+
+# Streaming pipeline: parse and match each page as it arrives (against a
+# MATCH_BACKEND index of that page), keeping a running best per item instead
+# of building the whole catalog first. Candidates are cut per page, so a match
+# can differ from the batch path when one page has more than
+# MATCH_CANDIDATE_LIMIT near-matches for a keyword; set False for batch results
+FASTBUY_STREAMING = True
+
+# On-disk page cache: entries are revalidated with ETag/Last-Modified, or
+# reused without a request while younger than FASTBUY_CACHE_MAX_AGE seconds.
+FASTBUY_CACHE_ENABLED = True
+FASTBUY_CACHE_DIR = ".kaitori_cache/http"
+FASTBUY_CACHE_MAX_AGE = 0.0
+FASTBUY_CACHE_MAX_BYTES = 50 * 1024 * 1024
+
 FASTBUY_SELECTORS = {
     "product_card": "a[href*='goodsdetail']",
+    "product_card_xpath": "//a[contains(@href, 'goodsdetail')]",
 }
 
+# Page parser backend: "lxml" (XPath directly on the lxml tree) or "bs4"
+FASTBUY_PARSER = "lxml"
+
 # Actual format from HTML: "5,900 ~ 7,000円" (no ¥ prefix, 円 suffix)
 # Require 円 at end OR ¥ at start to avoid matching bare numbers in product names
 FASTBUY_PRICE_PATTERN = r"(?:[￥¥]\s*(\d{1,3}(?:,\d{3})*)\s*(?:[~～]\s*(\d{1,3}(?:,\d{3})*))?|(\d{1,3}(?:,\d{3})*)\s*(?:[~～]\s*(\d{1,3}(?:,\d{3})*))?\s*円)"
@@ -26,15 +51,80 @@ def fastbuy_page_url(page: int) -> str:
 
 ONECHOME_BASE_URL = "https://1-chome.com"
 ONECHOME_SEARCH_DELAY = (3.0, 6.0)
-ONECHOME_SEARCH_TIMEOUT = 15000
+ONECHOME_SEARCH_TIMEOUT = 15000  # ms ceiling for homepage / search results readiness
 ONECHOME_PRICE_PATTERN = r"[￥¥]\s*(\d{1,3}(?:,\d{3})*)"
 
+# Worker pool: N browser contexts search in parallel; searches from all
+# workers share one per-host rate limiter.
+ONECHOME_WORKERS = 3
+ONECHOME_RATE_LIMIT = 0.5  # searches/second
+ONECHOME_RATE_BURST = 1
+
+# Web app: Chromium and its homepage-loaded pages stay alive between jobs;
+# the browser is relaunched after this many runs (or when it crashes)
+ONECHOME_BROWSER_MAX_USES = 20
+
+# Cookies/localStorage saved after a successful run and loaded into new
+# browser contexts, so cold starts resume the SPA's session state.
+# None disables.
+ONECHOME_STORAGE_STATE = ".kaitori_cache/onechome_state.json"
+
+# Search results route; "{keyword}" is replaced by the URL-encoded keyword.
+# When set, pages skip the homepage and each search navigates straight to
+# this route, falling back to the search form if no results state appears.
+ONECHOME_SEARCH_URL: str | None = None
+
+# Without a configured route, learn it from the address bar after a form
+# search (the SPA routes to /searchResult) and remember it for later runs.
+# A learned route that stops producing results is forgotten again.
+ONECHOME_DISCOVER_SEARCH_URL = True
+ONECHOME_SEARCH_URL_FILE = ".kaitori_cache/onechome_search_url.txt"
+
 # Confirmed via Playwright DOM inspection (Element Plus / Vue.js)
 ONECHOME_SELECTORS = {
     "search_input": "input.el-input__inner[placeholder*='商品名']",
     "search_button": "button.search-btn",
     "product_card": ".commodity-item",
     "product_name": ".commodity-content .title",
+    # Element Plus empty-state component shown when a search has no hits
+    "no_results": ".el-empty",
+}
+
+# Search XHR capture: build products from the search API's JSON response
+# instead of the rendered DOM. The response must match the pattern and carry
+# the keyword; it races the DOM readiness check, and if the DOM wins (or no
+# response arrives within ONECHOME_XHR_TIMEOUT ms) capture is turned off for
+# the rest of the scrape and results are parsed from the DOM.
+ONECHOME_CAPTURE_XHR = True
+ONECHOME_XHR_TIMEOUT = 8000
+ONECHOME_SEARCH_API_PATTERN = r"/api/.*(?:search|goods|commodity)"
+
+# Resource filtering on the browser context: abort requests of these types
+# and requests to (subdomains of) known tracker hosts. Stylesheets and
+# third-party scripts are kept: the SPA may load its bundle or API elsewhere.
+ONECHOME_BLOCK_RESOURCES = True
+ONECHOME_BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}
+ONECHOME_BLOCKED_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googlesyndication.com",
+    "facebook.net",
+    "clarity.ms",
+    "hotjar.com",
+    "yjtag.jp",
+)
+# Optional allowlist: None allows every other host; a tuple such as
+# ("1-chome.com",) aborts anything else. Each third-party host is logged once
+# at debug level so an allowlist can be built from real traffic.
+ONECHOME_ALLOWED_HOSTS: tuple[str, ...] | None = None
+
+# Candidate JSON keys per field, checked in order on each result record
+ONECHOME_JSON_FIELDS = {
+    "name": ("name", "goodsName", "goods_name", "commodityName", "title"),
+    "price": ("price", "buyPrice", "buy_price", "recyclePrice", "purchasePrice"),
+    "jan": ("jan", "janCode", "jan_code", "barcode"),
+    "condition": ("condition", "conditionName", "status", "state"),
 }
 
 # ── Anti-scraping ──
@@ -57,10 +147,55 @@ def random_user_agent() -> str:
     return random.choice(USER_AGENTS)
 
 
+# ── Orchestration ──
+
+# Run the site scrapers in parallel ("both" takes max(site) instead of sum)
+SCRAPE_CONCURRENT_SITES = True
+
+# CPU-bound HTML parsing and matching run off the event loop:
+#   "thread" | "process" | "inline" (on the loop, as before)
+PARSE_EXECUTOR = "thread"
+PARSE_WORKERS = 4
+
 # ── Matching ──
 
 MATCH_THRESHOLD = 0.5
 
+# Candidate backend for catalog-wide and per-page (streaming) matching:
+#   "ngram"  — inverted n-gram index (pure Python)
+#   "vector" — NumPy keyword x product similarity matrix
+MATCH_BACKEND = "ngram"
+
+# Max products per keyword returned by the n-gram candidate index
+MATCH_CANDIDATE_LIMIT = 50
+# Top-k products per keyword kept by the vector backend
+MATCH_VECTOR_TOP_K = 50
+
+# ── Price history ──
+
+HISTORY_ENABLED = True
+HISTORY_DB_PATH = "price_history.db"
+
+# Incremental mode: reuse an item's recorded match younger than this many
+# seconds (per site) and only scrape stale or missing items
+INCREMENTAL_TTL = {
+    "fastbuy": 6 * 3600,
+    "1chome": 6 * 3600,
+}
+# Per-item overrides: collection item id -> {site: seconds}, e.g. a volatile
+# item refreshed hourly on 1-chome: {7: {"1chome": 3600}}
+INCREMENTAL_TTL_OVERRIDES: dict[int, dict[str, float]] = {}
+
+# ── Scheduled scrapes (web app) ──
+
+# Jobs the web app's scheduler submits periodically, e.g.
+#   {"mode": "both", "interval": 6 * 3600, "incremental": True}
+# A tick is skipped while the entry's previous job is still queued or running.
+SCHEDULED_SCRAPES: list[dict] = []
+
+# Each wait is the interval scaled by a random factor in 1 +/- this fraction
+SCHEDULE_JITTER = 0.1
+
 # ── Retry ──
 
 MAX_RETRIES = 3
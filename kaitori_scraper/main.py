@@ -6,6 +6,10 @@ Usage:
     python -m kaitori_scraper.main --fastbuy-only     # Fastbuy only
     python -m kaitori_scraper.main --onechome-only    # 1-chome only
     python -m kaitori_scraper.main --items 5,8,14     # Specific items
+    python -m kaitori_scraper.main --cache-max-age 600  # Reuse pages < 10 min old
+    python -m kaitori_scraper.main --sequential       # One site after the other
+    python -m kaitori_scraper.main --incremental      # Only re-scrape stale items
+    python -m kaitori_scraper.main --history 8        # Recorded prices of item 8
 """
 
 import argparse
@@ -15,10 +19,19 @@ import sys
 from datetime import datetime
 
 from kaitori_scraper.config.collection import get_collection_by_ids
+from kaitori_scraper.config.settings import (
+    FASTBUY_CACHE_MAX_AGE,
+    HISTORY_DB_PATH,
+    HISTORY_ENABLED,
+    SCRAPE_CONCURRENT_SITES,
+)
 from kaitori_scraper.scrapers.fastbuy_scraper import FastbuyScraper
 from kaitori_scraper.scrapers.onechome_scraper import OneChomeScraper
+from kaitori_scraper.scrapers.runner import run_scrapers
+from kaitori_scraper.models.data import Site
 from kaitori_scraper.output.comparator import compare_results
 from kaitori_scraper.output.report import save_reports, generate_text_report
+from kaitori_scraper.storage.price_history import PriceHistory
 
 
 def parse_args() -> argparse.Namespace:
@@ -47,6 +60,47 @@ def parse_args() -> argparse.Namespace:
         default=".",
         help="Directory for output reports (default: current dir)",
     )
+    parser.add_argument(
+        "--sequential",
+        action="store_true",
+        help="Scrape the sites one after another instead of concurrently",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reuse recorded matches younger than INCREMENTAL_TTL and only "
+             "scrape stale items",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the on-disk fastbuy page cache",
+    )
+    parser.add_argument(
+        "--cache-max-age",
+        type=float,
+        default=FASTBUY_CACHE_MAX_AGE,
+        help="Reuse cached fastbuy pages younger than this many seconds "
+             "without revalidating (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--db",
+        type=str,
+        default=HISTORY_DB_PATH,
+        help="SQLite price-history database (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--no-history",
+        action="store_true",
+        help="Do not record this run in the price-history database",
+    )
+    parser.add_argument(
+        "--history",
+        type=int,
+        metavar="ITEM_ID",
+        default=None,
+        help="Print the recorded price series for one item and exit",
+    )
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -66,6 +120,10 @@ async def main() -> None:
     )
     logger = logging.getLogger("main")
 
+    if args.history is not None:
+        print_price_series(PriceHistory(args.db), args.history)
+        return
+
     # Parse item IDs
     item_ids = None
     if args.items:
@@ -75,24 +133,30 @@ async def main() -> None:
     logger.info(f"Target: {len(items)} collection items")
 
     timestamp = datetime.now()
-    fastbuy_results = []
-    onechome_results = []
 
-    # Scrape fastbuy
+    scrapers = []
     if not args.onechome_only:
-        logger.info("=" * 40)
-        logger.info("Starting fastbuy.jp scrape...")
-        logger.info("=" * 40)
-        scraper = FastbuyScraper()
-        fastbuy_results = await scraper.scrape(items)
-
-    # Scrape 1-chome
+        scrapers.append(FastbuyScraper(
+            use_cache=not args.no_cache, cache_max_age=args.cache_max_age
+        ))
     if not args.fastbuy_only:
-        logger.info("=" * 40)
-        logger.info("Starting 1-chome.com scrape...")
-        logger.info("=" * 40)
-        scraper = OneChomeScraper()
-        onechome_results = await scraper.scrape(items)
+        scrapers.append(OneChomeScraper())
+
+    concurrent = SCRAPE_CONCURRENT_SITES and not args.sequential
+    logger.info("=" * 40)
+    logger.info(
+        f"Starting {' + '.join(s.site.value for s in scrapers)} scrape "
+        f"({'concurrent' if concurrent else 'sequential'})..."
+    )
+    logger.info("=" * 40)
+    history = PriceHistory(args.db) if args.incremental else None
+    results, _, products = await run_scrapers(
+        scrapers, items, concurrent=concurrent, history=history
+    )
+
+    mode = "fastbuy" if args.fastbuy_only else "onechome" if args.onechome_only else "both"
+    fastbuy_results = results.get(Site.FASTBUY, [])
+    onechome_results = results.get(Site.ONECHOME, [])
 
     # Compare and report
     comparison = compare_results(items, fastbuy_results, onechome_results)
@@ -104,6 +168,31 @@ async def main() -> None:
     logger.info(f"Text report saved: {text_path}")
     logger.info(f"CSV report saved: {csv_path}")
 
+    if HISTORY_ENABLED and not args.no_history:
+        run_id = PriceHistory(args.db).save_run(
+            comparison,
+            mode,
+            timestamp,
+            completed_at=datetime.now(),
+            products=[p for site_products in products.values() for p in site_products],
+        )
+        logger.info(f"Run #{run_id} recorded in {args.db}")
+
+
+def print_price_series(history: PriceHistory, item_id: int) -> None:
+    points = history.price_series(item_id)
+    if not points:
+        print(f"No recorded prices for item {item_id}")
+        return
+    for point in points:
+        price = f"¥{point.price_low:,}"
+        if point.price_high:
+            price += f" ~ ¥{point.price_high:,}"
+        print(
+            f"{point.scraped_at:%Y-%m-%d %H:%M}  {point.site.value:<8} "
+            f"{price:<20} {point.product_name}"
+        )
+
 
 def entry() -> None:
     # Use default ProactorEventLoop on Windows (required by Playwright)
@@ -1,20 +1,33 @@
 """
 Multi-level fuzzy matching for Japanese product names.
 
-Levels (take max score):
+Levels (take max score; find_best_match evaluates them as a cascade and
+skips SequenceMatcher when its upper bound cannot beat the running best):
 1. Substring containment: keyword in product name -> 0.95
 2. Reverse containment: product name in keyword -> 0.90
 3. SequenceMatcher similarity -> 0.0-1.0
 4. Keyword hit rate: tokenized intersection -> 0.0-1.0
+
+Product names and keywords are normalized/tokenized once (PreparedProduct,
+PreparedKeyword) and reused across every comparison.
 """
 
+import math
 import re
+from collections.abc import Callable
+from dataclasses import dataclass
 from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from kaitori_scraper.models.data import (
     CollectionItem, ScrapedProduct, MatchResult, Site,
 )
-from kaitori_scraper.config.settings import MATCH_THRESHOLD
+from kaitori_scraper.config.settings import MATCH_BACKEND, MATCH_THRESHOLD
+
+if TYPE_CHECKING:
+    from kaitori_scraper.matcher.ngram_index import ProductIndex
+    from kaitori_scraper.matcher.vector_match import VectorIndex
 
 
 def _normalize(text: str) -> str:
@@ -41,9 +54,55 @@ def _tokenize(text: str, filter_stopwords: bool = False) -> set[str]:
     return tokens
 
 
-def compute_match_score(keyword: str, product_name: str) -> float:
-    kw = _normalize(keyword)
-    pn = _normalize(product_name)
+@dataclass(frozen=True)
+class PreparedKeyword:
+    """A search keyword normalized and tokenized once."""
+    text: str
+    normalized: str
+    tokens: frozenset[str]
+
+
+@dataclass
+class PreparedProduct:
+    """
+    A product name normalized and tokenized once at parse time.
+
+    `matcher` holds the name as SequenceMatcher's b-side so its lookup
+    tables are built once; each comparison only swaps in the keyword.
+    Not safe to share between threads.
+    """
+    normalized: str
+    tokens: frozenset[str]
+    matcher: SequenceMatcher
+
+
+@lru_cache(maxsize=1024)
+def prepare_keyword(keyword: str) -> PreparedKeyword:
+    return PreparedKeyword(
+        text=keyword,
+        normalized=_normalize(keyword),
+        tokens=frozenset(_tokenize(keyword, filter_stopwords=True)),
+    )
+
+
+def prepare_product(product_name: str) -> PreparedProduct:
+    normalized = _normalize(product_name)
+    return PreparedProduct(
+        normalized=normalized,
+        tokens=frozenset(_tokenize(product_name, filter_stopwords=True)),
+        matcher=SequenceMatcher(None, "", normalized),
+    )
+
+
+def _prepared(product: ScrapedProduct) -> PreparedProduct:
+    if product.prepared is None:
+        product.prepared = prepare_product(product.name)
+    return product.prepared
+
+
+def _score(keyword: PreparedKeyword, product: PreparedProduct) -> float:
+    kw = keyword.normalized
+    pn = product.normalized
 
     scores = []
 
@@ -56,48 +115,205 @@ def compute_match_score(keyword: str, product_name: str) -> float:
         scores.append(0.90)
 
     # Level 3: SequenceMatcher
-    scores.append(SequenceMatcher(None, kw, pn).ratio())
+    product.matcher.set_seq1(kw)
+    scores.append(product.matcher.ratio())
 
     # Level 4: token intersection (with stopword filtering)
-    kw_tokens = _tokenize(keyword, filter_stopwords=True)
-    pn_tokens = _tokenize(product_name, filter_stopwords=True)
-    if kw_tokens:
-        hit_rate = len(kw_tokens & pn_tokens) / len(kw_tokens)
+    if keyword.tokens:
+        hit_rate = len(keyword.tokens & product.tokens) / len(keyword.tokens)
         scores.append(hit_rate)
 
     return max(scores) if scores else 0.0
 
 
+def _score_above(
+    keyword: PreparedKeyword, product: PreparedProduct, floor: float
+) -> float:
+    """
+    Same as `_score`, but only exact when the result exceeds `floor`.
+
+    Cheap levels (containment, token hits) run first; SequenceMatcher's
+    real_quick_ratio/quick_ratio upper bounds then decide whether the full
+    ratio() can still raise the score above max(floor, cheap levels).
+    """
+    kw = keyword.normalized
+    pn = product.normalized
+
+    cheap = 0.0
+    if kw in pn:
+        cheap = 0.95
+    elif pn in kw:
+        cheap = 0.90
+    if keyword.tokens:
+        hit_rate = len(keyword.tokens & product.tokens) / len(keyword.tokens)
+        cheap = max(cheap, hit_rate)
+
+    bound = max(floor, cheap)
+    if bound >= 1.0:
+        return cheap
+
+    matcher = product.matcher
+    matcher.set_seq1(kw)
+    if matcher.real_quick_ratio() <= bound or matcher.quick_ratio() <= bound:
+        return cheap
+    return max(cheap, matcher.ratio())
+
+
+def compute_match_score(keyword: str, product_name: str) -> float:
+    return _score(prepare_keyword(keyword), prepare_product(product_name))
+
+
 def find_best_match(
     item: CollectionItem,
     products: list[ScrapedProduct],
     site: Site,
+    index: "ProductIndex | VectorIndex | None" = None,
 ) -> MatchResult:
+    """
+    Score every keyword of `item` against `products` and keep the best hit.
+
+    When an `index` built over the same products is given, only its n-gram
+    candidates for each keyword are scored.
+    """
     best_score = 0.0
     best_product = None
     best_keyword = None
 
     for keyword in item.search_keywords:
-        for product in products:
-            score = compute_match_score(keyword, product.name)
+        prepared_kw = prepare_keyword(keyword)
+        candidates = index.candidates(keyword) if index is not None else products
+        for product in candidates:
+            score = _score_above(prepared_kw, _prepared(product), best_score)
             if score > best_score:
                 best_score = score
                 best_product = product
                 best_keyword = keyword
+                if best_score >= 1.0:
+                    break  # perfect hit, nothing later can replace it
+        if best_score >= 1.0:
+            break
+
+    return _match_result(item, best_product, best_score, best_keyword, site)
 
-    if best_score < MATCH_THRESHOLD:
+
+def _match_result(
+    item: CollectionItem,
+    product: ScrapedProduct | None,
+    score: float,
+    keyword: str | None,
+    site: Site,
+) -> MatchResult:
+    if score < MATCH_THRESHOLD:
         return MatchResult(
             collection_item=item,
             product=None,
-            score=best_score,
-            matched_keyword=best_keyword,
+            score=score,
+            matched_keyword=keyword,
             site=site,
         )
 
     return MatchResult(
         collection_item=item,
-        product=best_product,
-        score=best_score,
-        matched_keyword=best_keyword,
+        product=product,
+        score=score,
+        matched_keyword=keyword,
         site=site,
     )
+
+
+def _build_index(
+    products: list[ScrapedProduct], keywords: list[str]
+) -> "ProductIndex | VectorIndex":
+    """Candidate index over `products` for the MATCH_BACKEND setting."""
+    # Imported here: both index modules depend on this one, and the vector
+    # backend pulls in NumPy only when selected.
+    if MATCH_BACKEND == "vector":
+        from kaitori_scraper.matcher.vector_match import VectorIndex
+
+        return VectorIndex(products, keywords)
+
+    from kaitori_scraper.matcher.ngram_index import ProductIndex
+
+    return ProductIndex(products)
+
+
+def find_best_matches(
+    items: list[CollectionItem],
+    products: list[ScrapedProduct],
+    site: Site,
+) -> list[MatchResult]:
+    """Match every item against one catalog using the MATCH_BACKEND index."""
+    keywords = [kw for item in items for kw in item.search_keywords]
+    index = _build_index(products, keywords)
+    return [find_best_match(item, products, site, index=index) for item in items]
+
+
+class IncrementalMatcher:
+    """
+    Running best match per collection item over a catalog that arrives in
+    chunks (e.g. crawled pages, possibly out of order).
+
+    Each chunk gets its own MATCH_BACKEND index and only its candidates are
+    scored. With `use_index=False` every product is scored and `results()`
+    equals `find_best_match` over all chunks concatenated in chunk order:
+    ties keep the first hit by (keyword, chunk, position). With the index,
+    candidates are cut per chunk rather than over the whole catalog, so a
+    result can differ from `find_best_matches` when a chunk holds more
+    near-matches for a keyword than the candidate limit.
+    `on_improve` is called with the provisional MatchResult whenever an
+    item's running best changes, so callers can publish early.
+    """
+
+    def __init__(
+        self,
+        items: list[CollectionItem],
+        site: Site,
+        on_improve: Callable[[MatchResult], None] | None = None,
+        use_index: bool = True,
+    ):
+        self.items = items
+        self.site = site
+        self.on_improve = on_improve
+        self.use_index = use_index
+        self._keywords = [kw for item in items for kw in item.search_keywords]
+        # item id -> (score, (keyword idx, chunk, position), product, keyword)
+        self._best: dict[int, tuple[float, tuple, ScrapedProduct | None, str | None]] = {
+            item.id: (0.0, (), None, None) for item in items
+        }
+
+    def add(self, chunk: int, products: list[ScrapedProduct]) -> None:
+        if not products:
+            return
+        index = _build_index(products, self._keywords) if self.use_index else None
+
+        for item in self.items:
+            best_score, best_key, best_product, best_keyword = self._best[item.id]
+            improved = False
+
+            for kw_idx, keyword in enumerate(item.search_keywords):
+                prepared_kw = prepare_keyword(keyword)
+                # Candidates keep chunk order, so positions compare like a full scan's
+                candidates = index.candidates(keyword) if index is not None else products
+                for pos, product in enumerate(candidates):
+                    key = (kw_idx, chunk, pos)
+                    # An earlier position also wins ties, so it only needs >=
+                    floor = best_score
+                    if best_product is not None and key < best_key:
+                        floor = math.nextafter(best_score, -math.inf)
+                    score = _score_above(prepared_kw, _prepared(product), floor)
+                    if score > floor:
+                        best_score, best_key = score, key
+                        best_product, best_keyword = product, keyword
+                        improved = True
+
+            if improved:
+                self._best[item.id] = (best_score, best_key, best_product, best_keyword)
+                if self.on_improve:
+                    self.on_improve(self.result(item))
+
+    def result(self, item: CollectionItem) -> MatchResult:
+        score, _, product, keyword = self._best[item.id]
+        return _match_result(item, product, score, keyword, self.site)
+
+    def results(self) -> list[MatchResult]:
+        return [self.result(item) for item in self.items]
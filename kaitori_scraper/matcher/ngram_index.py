@@ -0,0 +1,64 @@
+"""
+Character n-gram inverted index over normalized product names.
+
+Built once per crawl; `candidates()` returns the products sharing the most
+bigrams/trigrams with a keyword (the top `limit`, widened to keep ties and
+names made only of keyword n-grams) so `find_best_match` only runs the full
+scoring levels on a short list instead of the whole catalog.
+"""
+
+from collections import Counter, defaultdict
+
+from kaitori_scraper.models.data import ScrapedProduct
+from kaitori_scraper.matcher.fuzzy_match import _prepared, prepare_keyword
+from kaitori_scraper.config.settings import MATCH_CANDIDATE_LIMIT
+
+NGRAM_SIZES = (2, 3)
+
+
+def ngram_counts(text: str) -> Counter[str]:
+    """Bigram/trigram counts of a normalized name, ignoring spaces."""
+    compact = text.replace(" ", "")
+    return Counter(
+        compact[i:i + n]
+        for n in NGRAM_SIZES
+        for i in range(len(compact) - n + 1)
+    )
+
+
+class ProductIndex:
+    def __init__(self, products: list[ScrapedProduct]):
+        self.products = products
+        self._postings: dict[str, list[int]] = defaultdict(list)
+        # Distinct n-grams per product
+        self._sizes: list[int] = []
+        for i, product in enumerate(products):
+            grams = ngram_counts(_prepared(product).normalized)
+            self._sizes.append(len(grams))
+            for gram in grams:
+                self._postings[gram].append(i)
+
+    def __len__(self) -> int:
+        return len(self.products)
+
+    def candidates(
+        self, keyword: str, limit: int = MATCH_CANDIDATE_LIMIT
+    ) -> list[ScrapedProduct]:
+        grams = ngram_counts(prepare_keyword(keyword).normalized)
+        if not grams:
+            # Single-character keyword: nothing to index on
+            return self.products
+
+        hits: Counter[int] = Counter()
+        for gram in grams:
+            hits.update(self._postings.get(gram, ()))
+
+        ranked = hits.most_common()
+        if len(ranked) > limit:
+            # Never split a tie at the cut (an exact-name hit may share the
+            # top count with many longer names), and keep names whose every
+            # n-gram is in the keyword: they may be contained in it (level 2)
+            cut = ranked[limit - 1][1]
+            ranked = [(i, n) for i, n in ranked if n >= cut or n == self._sizes[i]]
+        # Keep catalog order so ties resolve exactly as a full scan would
+        return [self.products[i] for i in sorted(i for i, _ in ranked)]
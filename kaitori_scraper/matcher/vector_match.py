@@ -0,0 +1,83 @@
+"""
+NumPy batch backend for matching many keywords against one catalog.
+
+Normalized names are encoded as character n-gram count vectors and the whole
+keyword x product cosine-similarity matrix is computed in one product. Each
+keyword keeps its top-k products as candidates, which `find_best_match` then
+scores with the usual containment / SequenceMatcher / token-hit levels.
+
+The vocabulary is restricted to n-grams that occur in the keywords (other
+columns cannot contribute to a dot product); product norms still use the
+full n-gram counts.
+"""
+
+import math
+
+import numpy as np
+
+from kaitori_scraper.models.data import ScrapedProduct
+from kaitori_scraper.matcher.fuzzy_match import _prepared, prepare_keyword
+from kaitori_scraper.matcher.ngram_index import ngram_counts
+from kaitori_scraper.config.settings import MATCH_VECTOR_TOP_K
+
+
+class VectorIndex:
+    def __init__(
+        self,
+        products: list[ScrapedProduct],
+        keywords: list[str],
+        top_k: int = MATCH_VECTOR_TOP_K,
+    ):
+        self.products = products
+        keywords = list(dict.fromkeys(keywords))
+        kw_counts = [ngram_counts(prepare_keyword(kw).normalized) for kw in keywords]
+
+        vocab: dict[str, int] = {}
+        for counts in kw_counts:
+            for gram in counts:
+                vocab.setdefault(gram, len(vocab))
+
+        kw_matrix = np.zeros((len(keywords), len(vocab)), dtype=np.float32)
+        for row, counts in enumerate(kw_counts):
+            for gram, n in counts.items():
+                kw_matrix[row, vocab[gram]] = n
+
+        product_matrix = np.zeros((len(products), len(vocab)), dtype=np.float32)
+        product_norms = np.zeros(len(products), dtype=np.float32)
+        for row, product in enumerate(products):
+            counts = ngram_counts(_prepared(product).normalized)
+            product_norms[row] = math.sqrt(sum(n * n for n in counts.values()))
+            for gram, n in counts.items():
+                col = vocab.get(gram)
+                if col is not None:
+                    product_matrix[row, col] = n
+
+        kw_norms = np.linalg.norm(kw_matrix, axis=1)
+        denom = np.outer(kw_norms, product_norms)
+        sim = np.divide(
+            kw_matrix @ product_matrix.T,
+            denom,
+            out=np.zeros_like(denom),
+            where=denom > 0,
+        )
+
+        self._candidates: dict[str, list[ScrapedProduct]] = {}
+        k = min(top_k, len(products))
+        # Same fallback and ordering rules as ProductIndex.candidates
+        for row, keyword in enumerate(keywords):
+            if not kw_counts[row]:
+                self._candidates[keyword] = products
+                continue
+            if k == 0:
+                self._candidates[keyword] = []
+                continue
+            top = np.argpartition(-sim[row], k - 1)[:k]
+            self._candidates[keyword] = [
+                products[i] for i in sorted(top) if sim[row, i] > 0
+            ]
+
+    def __len__(self) -> int:
+        return len(self.products)
+
+    def candidates(self, keyword: str) -> list[ScrapedProduct]:
+        return self._candidates.get(keyword, self.products)
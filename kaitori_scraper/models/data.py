@@ -1,7 +1,11 @@
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional
 from enum import Enum
 
+if TYPE_CHECKING:
+    from kaitori_scraper.matcher.fuzzy_match import PreparedProduct
+
 
 class ProductType(Enum):
     BOX = "BOX"
@@ -37,6 +41,10 @@ class ScrapedProduct:
     is_enhanced: bool = False
     variant: Optional[str] = None
     condition: Optional[str] = None
+    # Matcher-side normalized name, filled in once at parse time
+    prepared: Optional["PreparedProduct"] = field(
+        default=None, repr=False, compare=False
+    )
 
 
 @dataclass
@@ -47,6 +55,27 @@ class MatchResult:
     score: float
     matched_keyword: Optional[str]
     site: Site
+    # Set when the result was reused from price history instead of scraped
+    fetched_at: Optional[datetime] = None
+    cached: bool = False
+
+
+class ProgressKind(Enum):
+    START = "start"      # phase begins; total = units of work
+    ADVANCE = "advance"  # done of total units finished
+    ITEM = "item"        # one collection item resolved; match carries the outcome
+    END = "end"          # site finished (or had nothing to do)
+
+
+@dataclass
+class ProgressEvent:
+    """Structured progress report emitted by a scraper."""
+    site: Site
+    kind: ProgressKind
+    phase: str = ""
+    done: int = 0
+    total: int = 0
+    match: Optional[MatchResult] = None
 
 
 @dataclass
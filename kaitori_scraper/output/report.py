@@ -40,7 +40,9 @@ def generate_text_report(rows: list[ComparisonRow], timestamp: datetime) -> str:
                 price_str = f"¥{p.price_low:,}"
                 total_fb_low += p.price_low * item.quantity
                 total_fb_high += p.price_low * item.quantity
-            lines.append(f"  fastbuy.jp:  {price_str}{enhanced}")
+            lines.append(
+                f"  fastbuy.jp:  {price_str}{enhanced}{_cached_note(row.fastbuy_match)}"
+            )
             lines.append(f"    匹配商品: {p.name}")
             lines.append(
                 f"    匹配度: {row.fastbuy_match.score:.0%}  |  "
@@ -57,7 +59,7 @@ def generate_text_report(rows: list[ComparisonRow], timestamp: datetime) -> str:
             has_oc = True
             price_str = f"¥{p.price_low:,}"
             total_oc += p.price_low * item.quantity
-            lines.append(f"  1-chome:     {price_str}")
+            lines.append(f"  1-chome:     {price_str}{_cached_note(row.onechome_match)}")
             lines.append(f"    匹配商品: {p.name}")
             lines.append(f"    匹配度: {row.onechome_match.score:.0%}")
         else:
@@ -100,6 +102,7 @@ def generate_csv_report(rows: list[ComparisonRow], timestamp: datetime) -> str:
         "fastbuy下限", "fastbuy上限", "fastbuy匹配商品", "fastbuy匹配度",
         "1chome価格", "1chome匹配商品", "1chome匹配度",
         "価格差(1chome-fastbuy)", "推奨",
+        "fastbuy取得", "1chome取得",
     ])
 
     for row in rows:
@@ -121,11 +124,27 @@ def generate_csv_report(rows: list[ComparisonRow], timestamp: datetime) -> str:
             f"{oc.score:.0%}" if oc and oc.product else "",
             row.price_diff if row.price_diff is not None else "",
             row.recommendation or "",
+            _freshness(fb),
+            _freshness(oc),
         ])
 
     return output.getvalue()
 
 
+def _cached_note(match: MatchResult) -> str:
+    if not match.cached or not match.fetched_at:
+        return ""
+    return f"  (キャッシュ {match.fetched_at.strftime('%m-%d %H:%M')})"
+
+
+def _freshness(match: MatchResult | None) -> str:
+    if not match:
+        return ""
+    if match.cached and match.fetched_at:
+        return f"cached {match.fetched_at.strftime('%Y-%m-%d %H:%M')}"
+    return "fresh"
+
+
 def save_reports(
     rows: list[ComparisonRow],
     output_dir: str = ".",
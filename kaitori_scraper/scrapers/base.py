@@ -1,29 +1,148 @@
 import asyncio
+import contextvars
+import multiprocessing
 import random
 import logging
+import threading
+import time
+import weakref
 from abc import ABC, abstractmethod
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from urllib.parse import urlsplit
 
-from kaitori_scraper.models.data import CollectionItem, MatchResult, Site
+from kaitori_scraper.models.data import (
+    CollectionItem, MatchResult, ProgressEvent, ProgressKind, ScrapedProduct, Site,
+)
 from kaitori_scraper.config.settings import (
     MAX_RETRIES, RETRY_BACKOFF_BASE, random_user_agent, DEFAULT_HEADERS,
+    PARSE_EXECUTOR, PARSE_WORKERS,
 )
 
+ProgressCallback = Callable[[ProgressEvent], None]
+
+_executor: Executor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_parse_executor() -> Executor | None:
+    """Shared pool for CPU-bound parsing/matching, or None to run inline."""
+    global _executor
+    if PARSE_EXECUTOR == "inline":
+        return None
+    with _executor_lock:
+        if _executor is None:
+            if PARSE_EXECUTOR == "process":
+                # spawn: forking a process that runs an event-loop thread is unsafe
+                _executor = ProcessPoolExecutor(
+                    PARSE_WORKERS, mp_context=multiprocessing.get_context("spawn")
+                )
+            else:
+                _executor = ThreadPoolExecutor(PARSE_WORKERS, thread_name_prefix="parse")
+        return _executor
+
+
+class RateLimiter:
+    """
+    Token bucket with an in-flight cap, shared by every request to one host.
+
+    `rate` tokens are added per second up to `burst`; each request consumes
+    one token and holds one of `max_in_flight` slots until it finishes.
+    """
+
+    def __init__(self, rate: float, burst: int = 1, max_in_flight: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self.max_in_flight = max_in_flight
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+        self._slots = asyncio.Semaphore(max_in_flight)
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    @asynccontextmanager
+    async def slot(self):
+        async with self._slots:
+            await self.acquire()
+            yield
+
 
 class BaseScraper(ABC):
     site: Site
 
-    def __init__(self):
+    # Shared across scraper instances so concurrent runs against the same host
+    # are throttled together. Keyed by event loop first: the limiter's asyncio
+    # primitives bind to the loop that first uses them.
+    _rate_limiters: weakref.WeakKeyDictionary[
+        asyncio.AbstractEventLoop, dict[str, RateLimiter]
+    ] = weakref.WeakKeyDictionary()
+
+    def __init__(self, on_progress: ProgressCallback | None = None):
         self.logger = logging.getLogger(self.__class__.__name__)
+        self.on_progress = on_progress
+        # Products seen by the last scrape, for scrapers that keep them
+        # (history storage); empty when the catalog is streamed
+        self.scraped_products: list[ScrapedProduct] = []
 
     @abstractmethod
     async def scrape(self, items: list[CollectionItem]) -> list[MatchResult]:
         ...
 
+    def _report_progress(self, kind: ProgressKind, **fields) -> None:
+        """Send a ProgressEvent to `on_progress`; a failing callback never aborts a scrape."""
+        if self.on_progress is None:
+            return
+        try:
+            self.on_progress(ProgressEvent(self.site, kind, **fields))
+        except Exception as e:
+            self.logger.debug(f"Progress callback failed: {e}")
+
     async def _delay(self, delay_range: tuple[float, float]) -> None:
         wait = random.uniform(*delay_range)
         self.logger.debug(f"Waiting {wait:.1f}s...")
         await asyncio.sleep(wait)
 
+    async def _run_cpu(self, func, *args, stateful: bool = False):
+        """
+        Run CPU-bound `func(*args)` on the parse executor, off the event loop.
+
+        `stateful` calls mutate objects owned by this process, so they run
+        inline when the executor is a process pool. Thread workers run in a
+        copy of the caller's context (like `asyncio.to_thread`), so context
+        variables such as the web app's current job reach their log records.
+        """
+        executor = get_parse_executor()
+        if executor is None or (stateful and isinstance(executor, ProcessPoolExecutor)):
+            return func(*args)
+        loop = asyncio.get_running_loop()
+        if isinstance(executor, ProcessPoolExecutor):
+            return await loop.run_in_executor(executor, func, *args)
+        return await loop.run_in_executor(executor, contextvars.copy_context().run, func, *args)
+
+    def _rate_limiter(
+        self, url: str, rate: float, burst: int = 1, max_in_flight: int = 1
+    ) -> RateLimiter:
+        host = urlsplit(url).netloc
+        limiters = self._rate_limiters.setdefault(asyncio.get_running_loop(), {})
+        limiter = limiters.get(host)
+        if limiter is None:
+            limiter = RateLimiter(rate, burst, max_in_flight)
+            limiters[host] = limiter
+        return limiter
+
     def _build_headers(self, referer: str | None = None) -> dict[str, str]:
         headers = {
             "User-Agent": random_user_agent(),
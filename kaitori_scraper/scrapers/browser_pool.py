@@ -0,0 +1,137 @@
+"""
+Long-lived Playwright browser shared by successive scrapes.
+
+Launching Chromium and loading the 1-chome homepage costs several seconds,
+which one-shot CLI runs pay once but the web app would pay on every job.
+BrowserManager keeps the browser and the already-navigated pages between
+leases. It health-checks pages before handing them out and relaunches the
+browser after `max_uses` leases or when it disconnects (crash).
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from contextlib import asynccontextmanager
+
+from playwright.async_api import (
+    async_playwright, Browser, Page, Playwright, Error as PlaywrightError,
+)
+
+from kaitori_scraper.config.settings import ONECHOME_BROWSER_MAX_USES, ONECHOME_WORKERS
+
+logger = logging.getLogger(__name__)
+
+PageOpener = Callable[[Browser], Awaitable[Page]]
+PageCheck = Callable[[Page], Awaitable[bool]]
+
+
+class BrowserManager:
+    def __init__(
+        self,
+        max_uses: int = ONECHOME_BROWSER_MAX_USES,
+        max_idle_pages: int = ONECHOME_WORKERS,
+    ):
+        self.max_uses = max_uses
+        self.max_idle_pages = max_idle_pages
+        self._playwright: Playwright | None = None
+        self._browser: Browser | None = None
+        self._idle: list[Page] = []
+        self._uses = 0
+        self._active = 0
+        self._lock = asyncio.Lock()
+
+    @asynccontextmanager
+    async def lease(self, count: int, open_page: PageOpener, check: PageCheck):
+        """
+        Yield `count` ready pages: idle ones that pass `check`, topped up
+        with `open_page(browser)`. Healthy pages go back to the idle pool
+        afterwards; the rest are closed.
+        """
+        async with self._lock:
+            if self._browser is not None and self._uses >= self.max_uses and not self._active:
+                logger.info(f"Recycling browser after {self._uses} uses")
+                await self._shutdown()
+            browser = await self._ensure_browser()
+            reused = self._idle[:count]
+            del self._idle[:count]
+            self._uses += 1
+            self._active += 1
+
+        pages: list[Page] = []
+        try:
+            healthy = await asyncio.gather(*(self._healthy(p, check) for p in reused))
+            pages = [p for p, ok in zip(reused, healthy) if ok]
+            for page, ok in zip(reused, healthy):
+                if not ok:
+                    await self._close_page(page)
+            opened = await asyncio.gather(
+                *(open_page(browser) for _ in range(count - len(pages))),
+                return_exceptions=True,
+            )
+            fresh = [p for p in opened if not isinstance(p, BaseException)]
+            failure = next((e for e in opened if isinstance(e, BaseException)), None)
+            if failure is not None:
+                # Don't leak the pages that did open; warm ones go back to the pool
+                for page in fresh:
+                    await self._close_page(page)
+                raise failure
+            logger.info(f"Browser lease: {len(pages)} warm pages, {len(fresh)} opened")
+            pages.extend(fresh)
+            yield pages
+        finally:
+            async with self._lock:
+                self._active -= 1
+                for page in pages:
+                    if (
+                        browser is self._browser
+                        and browser.is_connected()
+                        and not page.is_closed()
+                        and len(self._idle) < self.max_idle_pages
+                    ):
+                        self._idle.append(page)
+                    else:
+                        await self._close_page(page)
+
+    async def close(self) -> None:
+        async with self._lock:
+            await self._shutdown()
+
+    async def _ensure_browser(self) -> Browser:
+        if self._browser is not None and not self._browser.is_connected():
+            logger.warning("Browser disconnected; relaunching")
+            await self._shutdown()
+        if self._browser is None:
+            self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(headless=True)
+            self._uses = 0
+        return self._browser
+
+    async def _healthy(self, page: Page, check: PageCheck) -> bool:
+        if page.is_closed():
+            return False
+        try:
+            return await check(page)
+        except PlaywrightError:
+            return False
+
+    async def _close_page(self, page: Page) -> None:
+        # Pages may be tabs of a shared context; close the context with its last tab
+        context = page.context
+        try:
+            await page.close()
+            if not context.pages:
+                await context.close()
+        except PlaywrightError:
+            pass
+
+    async def _shutdown(self) -> None:
+        self._idle.clear()
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except PlaywrightError:
+                pass
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
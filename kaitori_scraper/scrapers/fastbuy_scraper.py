@@ -1,38 +1,89 @@
 """
-Fastbuy.jp scraper — SSR site, httpx + BeautifulSoup.
+Fastbuy.jp scraper — SSR site, httpx + lxml (BeautifulSoup backend selectable).
 
-Strategy: crawl all 7 category pages -> build product index -> fuzzy match.
+Strategy: crawl all 7 category pages -> fuzzy match. In streaming mode each page
+is parsed and matched as it arrives; otherwise a product index is built first.
+Pages are fetched concurrently through a per-host rate limiter and cached on
+disk (conditional GETs on rerun).
 """
 
+import asyncio
 import re
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 import httpx
 from bs4 import BeautifulSoup
+from lxml import etree
 
-from kaitori_scraper.scrapers.base import BaseScraper
-from kaitori_scraper.models.data import CollectionItem, ScrapedProduct, MatchResult, Site
-from kaitori_scraper.matcher.fuzzy_match import find_best_match
+from kaitori_scraper.scrapers.base import BaseScraper, ProgressCallback
+from kaitori_scraper.scrapers.http_cache import HttpCache
+from kaitori_scraper.models.data import (
+    CollectionItem, ScrapedProduct, MatchResult, ProgressKind, Site,
+)
+from kaitori_scraper.matcher.fuzzy_match import (
+    IncrementalMatcher, find_best_matches, prepare_product,
+)
 from kaitori_scraper.config.settings import (
     FASTBUY_TOTAL_PAGES,
     FASTBUY_REQUEST_DELAY,
+    FASTBUY_CONCURRENT_CRAWL,
+    FASTBUY_STREAMING,
+    FASTBUY_RATE_LIMIT,
+    FASTBUY_RATE_BURST,
+    FASTBUY_MAX_IN_FLIGHT,
+    FASTBUY_CACHE_ENABLED,
+    FASTBUY_CACHE_DIR,
+    FASTBUY_CACHE_MAX_AGE,
+    FASTBUY_CACHE_MAX_BYTES,
     FASTBUY_PRICE_PATTERN,
     FASTBUY_SELECTORS,
+    FASTBUY_PARSER,
     fastbuy_page_url,
 )
 
 logger = logging.getLogger(__name__)
 
+_PRICE_RE = re.compile(FASTBUY_PRICE_PATTERN)
+_PRODUCT_ID_RE = re.compile(r"id=(\d+)")
+_CARD_XPATH = etree.XPath(FASTBUY_SELECTORS["product_card_xpath"])
+_TEXT_XPATH = etree.XPath(".//text()")
+
+
+def new_http_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(follow_redirects=True, timeout=30.0)
+
 
 class FastbuyScraper(BaseScraper):
     site = Site.FASTBUY
 
+    def __init__(
+        self,
+        use_cache: bool = FASTBUY_CACHE_ENABLED,
+        cache_max_age: float = FASTBUY_CACHE_MAX_AGE,
+        on_progress: ProgressCallback | None = None,
+        client: httpx.AsyncClient | None = None,
+    ):
+        super().__init__(on_progress)
+        self.cache = (
+            HttpCache(FASTBUY_CACHE_DIR, FASTBUY_CACHE_MAX_BYTES) if use_cache else None
+        )
+        self.cache_max_age = cache_max_age
+        # Long-lived client owned by the caller (kept warm between runs)
+        self.client = client
+
     async def scrape(self, items: list[CollectionItem]) -> list[MatchResult]:
-        products = await self._crawl_all_pages()
-        logger.info(f"Crawled {len(products)} products from fastbuy.jp")
+        self.scraped_products = []
+        self._report_progress(ProgressKind.START, phase="crawl", total=FASTBUY_TOTAL_PAGES)
+        if FASTBUY_STREAMING:
+            results = await self._scrape_streaming(items)
+        else:
+            products = await self._crawl_all_pages()
+            logger.info(f"Crawled {len(products)} products from fastbuy.jp")
+            self.scraped_products = products
+            results = await self._run_cpu(find_best_matches, items, products, Site.FASTBUY)
 
-        results = []
-        for item in items:
-            match = find_best_match(item, products, Site.FASTBUY)
+        for item, match in zip(items, results):
             if match.product:
                 logger.info(
                     f"  [{item.id}] {item.name_jp} -> {match.product.name} "
@@ -42,102 +93,253 @@ class FastbuyScraper(BaseScraper):
                 logger.warning(
                     f"  [{item.id}] {item.name_jp} -> NO MATCH (best={match.score:.2f})"
                 )
-            results.append(match)
+            self._report_progress(ProgressKind.ITEM, phase="match", match=match)
 
+        self._report_progress(ProgressKind.END)
         return results
 
+    async def _scrape_streaming(self, items: list[CollectionItem]) -> list[MatchResult]:
+        """Parse and match each page as it arrives; the catalog is never held whole."""
+        matcher = IncrementalMatcher(items, Site.FASTBUY, on_improve=self._log_running_best)
+        total = 0
+
+        async with self._client() as client:
+            async for page, products in self._iter_pages(client):
+                await self._run_cpu(matcher.add, page, products, stateful=True)
+                total += len(products)
+
+        logger.info(f"Crawled {total} products from fastbuy.jp")
+        return matcher.results()
+
+    def _log_running_best(self, match: MatchResult) -> None:
+        if match.product:
+            logger.debug(
+                f"  Running best for #{match.collection_item.id}: "
+                f"{match.product.name} (score={match.score:.2f})"
+            )
+
+    @asynccontextmanager
+    async def _client(self):
+        if self.client is not None:
+            yield self.client
+            return
+        async with new_http_client() as client:
+            yield client
+
     async def _crawl_all_pages(self) -> list[ScrapedProduct]:
-        all_products: list[ScrapedProduct] = []
-        referer = "https://fastbuy.jp/"
+        page_products: dict[int, list[ScrapedProduct]] = {}
 
-        async with httpx.AsyncClient(follow_redirects=True, timeout=30.0) as client:
-            for page in range(1, FASTBUY_TOTAL_PAGES + 1):
-                url = fastbuy_page_url(page)
-                logger.info(f"Crawling page {page}/{FASTBUY_TOTAL_PAGES}: {url}")
+        async with self._client() as client:
+            async for page, products in self._iter_pages(client):
+                page_products[page] = products
 
-                response = await self._retry_operation(
-                    self._fetch_page, client, url, referer
-                )
+        # Page order, so matching ties resolve the same however pages arrived
+        return [p for page in sorted(page_products) for p in page_products[page]]
 
-                products = self._parse_page(response.text, page)
-                all_products.extend(products)
-                logger.info(f"  Page {page}: found {len(products)} products")
+    async def _iter_pages(
+        self, client: httpx.AsyncClient
+    ) -> AsyncIterator[tuple[int, list[ScrapedProduct]]]:
+        """Yield (page number, products) as pages are fetched and parsed, in arrival order."""
+        pages = range(1, FASTBUY_TOTAL_PAGES + 1)
+        referers = ["https://fastbuy.jp/"] + [fastbuy_page_url(p) for p in pages[:-1]]
 
-                referer = url
+        if not FASTBUY_CONCURRENT_CRAWL:
+            for page, referer in zip(pages, referers):
+                products = await self._crawl_page(client, page, referer)
+                self._report_page_done(page)
+                yield page, products
                 if page < FASTBUY_TOTAL_PAGES:
                     await self._delay(FASTBUY_REQUEST_DELAY)
+            return
+
+        # Politeness is enforced by the per-host limiter in _fetch_page. A page
+        # holds a slot from before its fetch until the consumer takes it, so
+        # at most FASTBUY_MAX_IN_FLIGHT pages are being fetched or waiting.
+        slots = asyncio.Semaphore(FASTBUY_MAX_IN_FLIGHT)
+        queue: asyncio.Queue[tuple[int, list[ScrapedProduct] | Exception]] = asyncio.Queue()
+
+        async def fetch(page: int, referer: str) -> None:
+            await slots.acquire()
+            try:
+                products = await self._crawl_page(client, page, referer)
+            except Exception as e:
+                queue.put_nowait((page, e))
+            else:
+                queue.put_nowait((page, products))
+
+        tasks = [
+            asyncio.create_task(fetch(page, referer))
+            for page, referer in zip(pages, referers)
+        ]
+        try:
+            for done in range(1, len(tasks) + 1):
+                page, products = await queue.get()
+                slots.release()
+                if isinstance(products, Exception):
+                    raise products
+                self._report_page_done(done)
+                yield page, products
+        finally:
+            for task in tasks:
+                task.cancel()
 
-        return all_products
+    def _report_page_done(self, done: int) -> None:
+        self._report_progress(
+            ProgressKind.ADVANCE, phase="crawl", done=done, total=FASTBUY_TOTAL_PAGES
+        )
+
+    async def _crawl_page(
+        self, client: httpx.AsyncClient, page: int, referer: str
+    ) -> list[ScrapedProduct]:
+        url = fastbuy_page_url(page)
+        logger.info(f"Crawling page {page}/{FASTBUY_TOTAL_PAGES}: {url}")
+
+        body, encoding = await self._retry_operation(self._fetch_page, client, url, referer)
+
+        products = await self._run_cpu(parse_page, body, encoding, FASTBUY_PARSER)
+        logger.info(f"  Page {page}: found {len(products)} products")
+        return products
 
     async def _fetch_page(
         self, client: httpx.AsyncClient, url: str, referer: str
-    ) -> httpx.Response:
-        headers = self._build_headers(referer=referer)
-        response = await client.get(url, headers=headers)
+    ) -> tuple[bytes, str]:
+        """
+        Raw page body and its encoding, from the cache or the network.
+
+        Cache file I/O runs in worker threads so concurrent page fetches
+        don't block the event loop on disk.
+        """
+        entry = await asyncio.to_thread(self.cache.get, url) if self.cache else None
+        if entry and entry.age() < self.cache_max_age:
+            logger.debug(f"  Cache hit ({entry.age():.0f}s old): {url}")
+            await asyncio.to_thread(self.cache.touch, url)
+            return entry.body, entry.encoding
+
+        limiter = self._rate_limiter(
+            url, FASTBUY_RATE_LIMIT, FASTBUY_RATE_BURST, FASTBUY_MAX_IN_FLIGHT
+        )
+        async with limiter.slot():
+            headers = self._build_headers(referer=referer)
+            if entry:
+                headers.update(entry.validators())
+            response = await client.get(url, headers=headers)
+
+        if entry and response.status_code == 304:
+            logger.debug(f"  Not modified: {url}")
+            await asyncio.to_thread(self.cache.touch, url, revalidated=True)
+            return entry.body, entry.encoding
+
         response.raise_for_status()
-        return response
+        encoding = response.encoding or "utf-8"
+        if self.cache:
+            await asyncio.to_thread(
+                self.cache.put,
+                url,
+                response.content,
+                encoding,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+        return response.content, encoding
 
-    def _parse_page(self, html: str, page_num: int) -> list[ScrapedProduct]:
-        soup = BeautifulSoup(html, "lxml")
-        products = []
 
-        cards = soup.select(FASTBUY_SELECTORS["product_card"])
-        for card in cards:
-            product = self._parse_product_card(card)
-            if product:
-                products.append(product)
+# Parsers are module-level functions of plain data: with a process-pool
+# parse executor only the HTML is pickled, not the scraper and its client.
 
-        return products
 
-    def _parse_product_card(self, card) -> ScrapedProduct | None:
-        # Extract URL and product ID
-        href = card.get("href", "")
-        product_url = f"https://fastbuy.jp{href}" if href.startswith("/") else href
-        product_id = None
-        id_match = re.search(r"id=(\d+)", href)
-        if id_match:
-            product_id = id_match.group(1)
-
-        # Extract text content
-        all_text = card.get_text(separator="\n", strip=True)
-        text_lines = [line.strip() for line in all_text.split("\n") if line.strip()]
-
-        # Product name: filter out short labels (色, 強化, etc.)
-        name_candidates = [t for t in text_lines if len(t) > 5]
-        if not name_candidates:
-            return None
-        product_name = name_candidates[0]
-
-        # 買取強化 flag
-        is_enhanced = "強化" in all_text
-
-        # Extract price
-        # Regex has 4 groups: (¥low, ¥high, 円low, 円high)
-        price_matches = re.findall(FASTBUY_PRICE_PATTERN, all_text)
-        if not price_matches:
-            return None
-
-        price_low = None
-        price_high = None
-        for match in price_matches:
-            # Groups 0,1 = ¥ prefix pattern; Groups 2,3 = 円 suffix pattern
-            low_str = (match[0] or match[2]).replace(",", "")
-            high_str = (match[1] or match[3]).replace(",", "")
-            if low_str and low_str.isdigit():
-                price_low = int(low_str)
-                if high_str and high_str.isdigit():
-                    price_high = int(high_str)
-                break
-
-        if price_low is None:
-            return None
-
-        return ScrapedProduct(
-            site=Site.FASTBUY,
-            name=product_name,
-            price_low=price_low,
-            price_high=price_high,
-            product_url=product_url,
-            product_id=product_id,
-            is_enhanced=is_enhanced,
+def parse_page(
+    body: bytes, encoding: str = "utf-8", backend: str = FASTBUY_PARSER
+) -> list[ScrapedProduct]:
+    """
+    Products on one category page. `body` is the raw response; `encoding`
+    is the HTTP charset, which overrides any declaration in the document.
+    """
+    if backend == "lxml":
+        return _parse_page_lxml(body, encoding)
+    return _parse_page_bs4(body, encoding)
+
+
+def _parse_page_bs4(body: bytes, encoding: str) -> list[ScrapedProduct]:
+    soup = BeautifulSoup(body, "lxml", from_encoding=encoding)
+    products = []
+
+    cards = soup.select(FASTBUY_SELECTORS["product_card"])
+    for card in cards:
+        product = _parse_product_card(
+            card.get("href", ""), card.get_text(separator="\n", strip=True)
         )
+        if product:
+            products.append(product)
+
+    return products
+
+
+def _parse_page_lxml(body: bytes, encoding: str) -> list[ScrapedProduct]:
+    """Fast path: lxml XPath, no BeautifulSoup tree. Same output as bs4."""
+    # Bytes, not str: lxml rejects str documents with an XML encoding declaration
+    tree = etree.HTML(body, parser=etree.HTMLParser(encoding=encoding))
+    if tree is None:  # empty document
+        return []
+    products = []
+
+    for card in _CARD_XPATH(tree):
+        # Equivalent to get_text(separator="\n", strip=True)
+        all_text = "\n".join(t.strip() for t in _TEXT_XPATH(card) if t.strip())
+        product = _parse_product_card(card.get("href", ""), all_text)
+        if product:
+            products.append(product)
+
+    return products
+
+
+def _parse_product_card(href: str, all_text: str) -> ScrapedProduct | None:
+    # Extract URL and product ID
+    product_url = f"https://fastbuy.jp{href}" if href.startswith("/") else href
+    product_id = None
+    id_match = _PRODUCT_ID_RE.search(href)
+    if id_match:
+        product_id = id_match.group(1)
+
+    # Extract text content
+    text_lines = [line.strip() for line in all_text.split("\n") if line.strip()]
+
+    # Product name: filter out short labels (色, 強化, etc.)
+    name_candidates = [t for t in text_lines if len(t) > 5]
+    if not name_candidates:
+        return None
+    product_name = name_candidates[0]
+
+    # 買取強化 flag
+    is_enhanced = "強化" in all_text
+
+    # Extract price
+    # Regex has 4 groups: (¥low, ¥high, 円low, 円high)
+    price_matches = _PRICE_RE.findall(all_text)
+    if not price_matches:
+        return None
+
+    price_low = None
+    price_high = None
+    for match in price_matches:
+        # Groups 0,1 = ¥ prefix pattern; Groups 2,3 = 円 suffix pattern
+        low_str = (match[0] or match[2]).replace(",", "")
+        high_str = (match[1] or match[3]).replace(",", "")
+        if low_str and low_str.isdigit():
+            price_low = int(low_str)
+            if high_str and high_str.isdigit():
+                price_high = int(high_str)
+            break
+
+    if price_low is None:
+        return None
+
+    return ScrapedProduct(
+        site=Site.FASTBUY,
+        name=product_name,
+        price_low=price_low,
+        price_high=price_high,
+        product_url=product_url,
+        product_id=product_id,
+        is_enhanced=is_enhanced,
+        prepared=prepare_product(product_name),
+    )
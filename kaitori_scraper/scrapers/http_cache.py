@@ -0,0 +1,128 @@
+"""
+On-disk HTTP response cache with conditional-request support.
+
+Each URL is stored as `<sha256>.body` (raw bytes) plus `<sha256>.json`
+(ETag, Last-Modified, encoding, fetch time). Body mtime doubles as the LRU
+clock: hits touch it, and `evict()` drops the least recently used entries
+once the cache exceeds `max_bytes`.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheEntry:
+    url: str
+    body: bytes
+    encoding: str
+    fetched_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @property
+    def text(self) -> str:
+        return self.body.decode(self.encoding, errors="replace")
+
+    def age(self) -> float:
+        return time.time() - self.fetched_at
+
+    def validators(self) -> dict[str, str]:
+        """Headers for a conditional GET revalidating this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HttpCache:
+    def __init__(self, directory: str | Path, max_bytes: int):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.directory / f"{key}.body", self.directory / f"{key}.json"
+
+    def get(self, url: str) -> CacheEntry | None:
+        body_path, meta_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            body = body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+        return CacheEntry(url=url, body=body, **meta)
+
+    def put(
+        self,
+        url: str,
+        body: bytes,
+        encoding: str,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> CacheEntry:
+        entry = CacheEntry(
+            url=url,
+            body=body,
+            encoding=encoding,
+            fetched_at=time.time(),
+            etag=etag,
+            last_modified=last_modified,
+        )
+        body_path, meta_path = self._paths(url)
+        meta = {
+            "encoding": entry.encoding,
+            "fetched_at": entry.fetched_at,
+            "etag": entry.etag,
+            "last_modified": entry.last_modified,
+        }
+        self._write_atomic(body_path, body)
+        self._write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+        self.evict()
+        return entry
+
+    def touch(self, url: str, revalidated: bool = False) -> None:
+        """Mark an entry as recently used; `revalidated` also resets its age."""
+        body_path, meta_path = self._paths(url)
+        try:
+            os.utime(body_path)
+            if revalidated:
+                meta = json.loads(meta_path.read_text(encoding="utf-8"))
+                meta["fetched_at"] = time.time()
+                self._write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+        except (OSError, ValueError):
+            pass
+
+    def evict(self) -> None:
+        bodies = []
+        for path in self.directory.glob("*.body"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            bodies.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in bodies)
+        for _, size, path in sorted(bodies):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            path.with_suffix(".json").unlink(missing_ok=True)
+            total -= size
+            logger.debug(f"Evicted cached response {path.name}")
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
@@ -1,7 +1,13 @@
 """
 1-chome.com scraper — SPA site (Element Plus / Vue.js), Playwright browser automation.
 
-Strategy: search by Japanese keyword per product, parse rendered DOM.
+Strategy: search by Japanese keyword per product, read products from the
+search API's JSON response (parsing the rendered DOM as fallback). Once the
+search route is known (configured or learned from a form search) each search
+is a single navigation; the homepage form remains the fallback.
+A pool of browser contexts pulls items from a shared queue and searches in
+parallel; results are returned in collection order. With a BrowserManager
+(web app) the browser and its loaded pages are reused across runs.
 Selectors confirmed via Playwright DOM inspection.
 
 Card text structure:
@@ -14,67 +20,293 @@ Card text structure:
     カートに入れる
 """
 
+import asyncio
+import json
+import os
 import re
 import logging
-from playwright.async_api import async_playwright, Page
+import time
+from collections import Counter
+from contextlib import asynccontextmanager
+from pathlib import Path
+from urllib.parse import quote, quote_plus, unquote_plus, urlsplit
+from playwright.async_api import (
+    async_playwright, Browser, BrowserContext, Page, Response, Route,
+    Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError,
+)
 
-from kaitori_scraper.scrapers.base import BaseScraper
-from kaitori_scraper.models.data import CollectionItem, ScrapedProduct, MatchResult, Site
-from kaitori_scraper.matcher.fuzzy_match import find_best_match
+from kaitori_scraper.scrapers.base import BaseScraper, ProgressCallback, RateLimiter
+from kaitori_scraper.scrapers.browser_pool import BrowserManager
+from kaitori_scraper.models.data import (
+    CollectionItem, ScrapedProduct, MatchResult, ProgressKind, Site,
+)
+from kaitori_scraper.matcher.fuzzy_match import find_best_match, prepare_product
 from kaitori_scraper.config.settings import (
     ONECHOME_BASE_URL,
     ONECHOME_SEARCH_DELAY,
+    ONECHOME_SEARCH_TIMEOUT,
     ONECHOME_PRICE_PATTERN,
     ONECHOME_SELECTORS,
+    ONECHOME_WORKERS,
+    ONECHOME_RATE_LIMIT,
+    ONECHOME_RATE_BURST,
+    ONECHOME_BLOCK_RESOURCES,
+    ONECHOME_BLOCKED_RESOURCE_TYPES,
+    ONECHOME_ALLOWED_HOSTS,
+    ONECHOME_BLOCKED_HOSTS,
+    ONECHOME_CAPTURE_XHR,
+    ONECHOME_XHR_TIMEOUT,
+    ONECHOME_SEARCH_API_PATTERN,
+    ONECHOME_JSON_FIELDS,
+    ONECHOME_STORAGE_STATE,
+    ONECHOME_SEARCH_URL,
+    ONECHOME_DISCOVER_SEARCH_URL,
+    ONECHOME_SEARCH_URL_FILE,
     random_user_agent,
     DEFAULT_HEADERS,
 )
 
 logger = logging.getLogger(__name__)
 
+_BASE_HOST = urlsplit(ONECHOME_BASE_URL).hostname.removeprefix("www.")
+
+# Runs in the page before a search: tag the current cards / empty state so
+# readiness only fires on nodes rendered by the new search
+_MARK_STALE_JS = """
+([cardSelector, emptySelector]) => {
+    for (const el of document.querySelectorAll(cardSelector + ',' + emptySelector)) {
+        el.setAttribute('data-kaitori-stale', '1');
+    }
+}
+"""
+
+_RESULTS_READY_JS = """
+([cardSelector, emptySelector]) => {
+    const fresh = el => !el.hasAttribute('data-kaitori-stale');
+    if ([...document.querySelectorAll(cardSelector)].some(fresh)) return 'results';
+    const empty = [...document.querySelectorAll(emptySelector)].find(fresh);
+    if (empty && empty.offsetParent !== null) return 'empty';
+    return false;
+}
+"""
+
+# Runs in the page: text and title-node text of every card in one call
+_EXTRACT_CARDS_JS = """
+(cards, titleSelector) => cards.map(card => {
+    const title = card.querySelector(titleSelector);
+    return {text: card.innerText, title: title ? title.innerText : null};
+})
+"""
+
 
 class OneChomeScraper(BaseScraper):
     site = Site.ONECHOME
 
-    async def scrape(self, items: list[CollectionItem]) -> list[MatchResult]:
-        results = []
+    def __init__(
+        self,
+        on_progress: ProgressCallback | None = None,
+        browser_manager: BrowserManager | None = None,
+    ):
+        super().__init__(on_progress)
+        # Shared warm browser (web app); None launches one per scrape
+        self.browser_manager = browser_manager
+        self.search_waits: list[float] = []
+        self.request_counts: Counter[str] = Counter()
+        self._seen_hosts: set[str] = set()
+        # Direct search route: configured, or learned from an earlier form search
+        self.search_url = ONECHOME_SEARCH_URL or _load_search_url()
+        self._tab_context: tuple[Browser, BrowserContext] | None = None
+        # Turned off after the first search whose API response went unmatched
+        self._capture_xhr = ONECHOME_CAPTURE_XHR
+        self._context_lock = asyncio.Lock()
 
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context(
-                user_agent=random_user_agent(),
-                locale="ja-JP",
-                extra_http_headers=DEFAULT_HEADERS,
+    async def scrape(self, items: list[CollectionItem]) -> list[MatchResult]:
+        self.scraped_products = []
+        results: list[MatchResult | None] = [None] * len(items)
+        self._report_progress(ProgressKind.START, phase="search", total=len(items))
+
+        queue: asyncio.Queue[tuple[int, CollectionItem]] = asyncio.Queue()
+        for index, item in enumerate(items):
+            queue.put_nowait((index, item))
+
+        worker_count = max(1, min(ONECHOME_WORKERS, len(items)))
+        async with self._pages(worker_count) as pages:
+            await asyncio.gather(
+                *(self._worker(page, queue, results) for page in pages)
+            )
+            if any(match and match.product for match in results):
+                await self._save_storage_state(pages[0])
+
+        if self.search_waits:
+            logger.info(
+                f"Search readiness: {len(self.search_waits)} searches, "
+                f"avg {sum(self.search_waits) / len(self.search_waits):.2f}s, "
+                f"max {max(self.search_waits):.2f}s"
+            )
+        if self.request_counts:
+            logger.info(
+                f"Browser requests: {self.request_counts['allowed']} allowed, "
+                f"{self.request_counts['blocked']} blocked"
             )
-            page = await context.new_page()
 
-            await page.goto(ONECHOME_BASE_URL, wait_until="networkidle")
-            logger.info("Loaded 1-chome.com homepage")
+        self._report_progress(ProgressKind.END)
+        return results
 
-            for item in items:
-                match = await self._search_item(page, item)
-                results.append(match)
+    @asynccontextmanager
+    async def _pages(self, count: int):
+        """`count` pages on 1-chome with the search box ready."""
+        if self.browser_manager is not None:
+            async with self.browser_manager.lease(
+                count, self._open_page, self._page_ready
+            ) as pages:
+                if ONECHOME_BLOCK_RESOURCES:
+                    # Warm pages still route through the scraper that opened them
+                    for page in pages:
+                        await page.context.unroute("**/*")
+                        await page.context.route("**/*", self._filter_request)
+                yield pages
+            return
 
-                if match.product:
-                    logger.info(
-                        f"  [{item.id}] {item.name_jp} -> {match.product.name} "
-                        f"(score={match.score:.2f}, ¥{match.product.price_low:,})"
-                    )
-                else:
-                    logger.warning(f"  [{item.id}] {item.name_jp} -> NO MATCH")
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=True)
+            try:
+                pages = await asyncio.gather(
+                    *(self._open_page(browser) for _ in range(count))
+                )
+                mode = "direct search route" if self.search_url else "homepage"
+                logger.info(f"Opened {count} 1-chome.com workers ({mode})")
+                yield pages
+            finally:
+                await browser.close()
+
+    async def _page_ready(self, page: Page) -> bool:
+        if self.search_url:
+            return True  # every search navigates itself
+        return await page.locator(ONECHOME_SELECTORS["search_input"]).first.is_visible()
+
+    async def _open_page(self, browser: Browser) -> Page:
+        if self.search_url:
+            # Searches are plain navigations, so workers can be tabs of one
+            # context sharing cookies and the HTTP cache; no homepage needed
+            return await (await self._shared_context(browser)).new_page()
+
+        page = await (await self._new_context(browser)).new_page()
+        async with self._limiter().slot():
+            await self._load_homepage(page)
+        return page
+
+    async def _shared_context(self, browser: Browser) -> BrowserContext:
+        async with self._context_lock:
+            if self._tab_context is None or self._tab_context[0] is not browser:
+                self._tab_context = (browser, await self._new_context(browser))
+            return self._tab_context[1]
+
+    async def _new_context(self, browser: Browser) -> BrowserContext:
+        options = dict(
+            user_agent=random_user_agent(),
+            locale="ja-JP",
+            extra_http_headers=DEFAULT_HEADERS,
+        )
+        state = ONECHOME_STORAGE_STATE
+        if state and os.path.exists(state):
+            try:
+                context = await browser.new_context(storage_state=state, **options)
+            except (PlaywrightError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable storage state {state}: {e}")
+                context = await browser.new_context(**options)
+        else:
+            context = await browser.new_context(**options)
+        if ONECHOME_BLOCK_RESOURCES:
+            await context.route("**/*", self._filter_request)
+        return context
+
+    async def _load_homepage(self, page: Page) -> None:
+        await page.goto(ONECHOME_BASE_URL, wait_until="domcontentloaded")
+        # Ready once the SPA has rendered the search box; no networkidle wait
+        await page.locator(ONECHOME_SELECTORS["search_input"]).first.wait_for(
+            state="visible", timeout=ONECHOME_SEARCH_TIMEOUT
+        )
 
-                await self._delay(ONECHOME_SEARCH_DELAY)
+    async def _save_storage_state(self, page: Page) -> None:
+        """Persist cookies/localStorage for the next cold start (atomic replace)."""
+        if not ONECHOME_STORAGE_STATE:
+            return
+        path = Path(ONECHOME_STORAGE_STATE)
+        tmp = path.with_suffix(".tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            await page.context.storage_state(path=tmp)
+            os.replace(tmp, path)
+        except (PlaywrightError, OSError) as e:
+            logger.debug(f"Could not save storage state: {e}")
+
+    async def _filter_request(self, route: Route) -> None:
+        request = route.request
+        host = urlsplit(request.url).hostname or ""
+        blocked = (
+            request.resource_type in ONECHOME_BLOCKED_RESOURCE_TYPES
+            or _host_in(host, ONECHOME_BLOCKED_HOSTS)
+            or (ONECHOME_ALLOWED_HOSTS is not None and not _host_in(host, ONECHOME_ALLOWED_HOSTS))
+        )
+        if host not in self._seen_hosts and not _host_in(host, (_BASE_HOST,)):
+            self._seen_hosts.add(host)
+            logger.debug(
+                f"Third-party host {host} ({request.resource_type}): "
+                f"{'blocked' if blocked else 'allowed'}"
+            )
+        if blocked:
+            self.request_counts["blocked"] += 1
+            await route.abort()
+        else:
+            self.request_counts["allowed"] += 1
+            await route.continue_()
+
+    async def _worker(
+        self,
+        page: Page,
+        queue: asyncio.Queue[tuple[int, CollectionItem]],
+        results: list[MatchResult | None],
+    ) -> None:
+        while True:
+            try:
+                index, item = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+
+            match = await self._search_item(page, item)
+            results[index] = match
+
+            if match.product:
+                logger.info(
+                    f"  [{item.id}] {item.name_jp} -> {match.product.name} "
+                    f"(score={match.score:.2f}, ¥{match.product.price_low:,})"
+                )
+            else:
+                logger.warning(f"  [{item.id}] {item.name_jp} -> NO MATCH")
+
+            self._report_progress(ProgressKind.ITEM, phase="search", match=match)
+            self._report_progress(
+                ProgressKind.ADVANCE,
+                phase="search",
+                done=sum(r is not None for r in results),
+                total=len(results),
+            )
 
-            await browser.close()
+            if not queue.empty():
+                await self._delay(ONECHOME_SEARCH_DELAY)
 
-        return results
+    def _limiter(self) -> RateLimiter:
+        return self._rate_limiter(
+            ONECHOME_BASE_URL, ONECHOME_RATE_LIMIT, ONECHOME_RATE_BURST, ONECHOME_WORKERS
+        )
 
     async def _search_item(self, page: Page, item: CollectionItem) -> MatchResult:
         all_products: list[ScrapedProduct] = []
 
         for keyword in item.search_keywords:
             try:
-                products = await self._perform_search(page, keyword)
+                async with self._limiter().slot():
+                    products = await self._perform_search(page, keyword)
                 all_products.extend(products)
                 if products:
                     logger.debug(f"  Keyword '{keyword}': found {len(products)} results")
@@ -83,6 +315,7 @@ class OneChomeScraper(BaseScraper):
                 logger.warning(f"  Search failed for '{keyword}': {e}")
                 continue
 
+        self.scraped_products.extend(all_products)
         if not all_products:
             return MatchResult(
                 collection_item=item,
@@ -92,88 +325,356 @@ class OneChomeScraper(BaseScraper):
                 site=Site.ONECHOME,
             )
 
-        return find_best_match(item, all_products, Site.ONECHOME)
+        return await self._run_cpu(find_best_match, item, all_products, Site.ONECHOME)
 
     async def _perform_search(self, page: Page, keyword: str) -> list[ScrapedProduct]:
+        if self.search_url:
+            products = await self._search_via_url(page, keyword)
+            if products is not None:
+                return products
+            logger.debug(f"  Search route gave no results state for '{keyword}', using form")
+            if not ONECHOME_SEARCH_URL and self.search_url:
+                self._forget_search_url()
+        return await self._search_via_form(page, keyword)
+
+    async def _search_via_url(self, page: Page, keyword: str) -> list[ScrapedProduct] | None:
+        """One navigation to the search route; None if no results state appeared."""
+        url = self.search_url.format(keyword=quote(keyword, safe=""))
+        started = time.monotonic()
+
+        async def navigate():
+            await page.goto(url, wait_until="domcontentloaded")
+
+        outcome, products = await self._run_search(page, keyword, navigate)
+        self._record_wait(keyword, started, f"url+{outcome}")
+        if products:
+            return products
+        if outcome == "timeout":
+            return None
+        return await self._parse_search_results(page)
+
+    async def _search_via_form(self, page: Page, keyword: str) -> list[ScrapedProduct]:
         search_input = page.locator(ONECHOME_SELECTORS["search_input"]).first
         search_btn = page.locator(ONECHOME_SELECTORS["search_button"]).first
 
         if not await search_input.is_visible(timeout=5000):
-            raise RuntimeError("Search input not visible")
+            # Tab opened for direct navigation, or left on an unexpected page
+            await self._load_homepage(page)  # raises if the search box never shows
 
         await search_input.fill("")
         await search_input.fill(keyword)
-        await search_btn.click()
-
-        await page.wait_for_load_state("networkidle")
-        await page.wait_for_timeout(2000)
 
+        await page.evaluate(
+            _MARK_STALE_JS,
+            [ONECHOME_SELECTORS["product_card"], ONECHOME_SELECTORS["no_results"]],
+        )
+        started = time.monotonic()
+
+        outcome, products = await self._run_search(page, keyword, search_btn.click)
+        self._record_wait(keyword, started, outcome)
+        if outcome != "timeout":
+            self._learn_search_url(page.url, keyword)
+        if products:
+            return products
         return await self._parse_search_results(page)
 
-    async def _parse_search_results(self, page: Page) -> list[ScrapedProduct]:
-        products = []
+    def _learn_search_url(self, url: str, keyword: str) -> None:
+        """Remember the SPA's search route if the keyword shows up in the address bar."""
+        if self.search_url or not ONECHOME_DISCOVER_SEARCH_URL:
+            return
+        template = _search_url_template(url, keyword)
+        if template is None:
+            return
+        self.search_url = template
+        logger.info(f"Learned 1-chome search route: {template}")
+        try:
+            path = Path(ONECHOME_SEARCH_URL_FILE)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(template, encoding="utf-8")
+        except OSError as e:
+            logger.debug(f"Could not save search route: {e}")
+
+    def _forget_search_url(self) -> None:
+        logger.info(f"Dropping learned search route {self.search_url}")
+        self.search_url = None
+        try:
+            os.remove(ONECHOME_SEARCH_URL_FILE)
+        except OSError:
+            pass
+
+    async def _wait_for_results(self, page: Page) -> str:
+        """
+        Wait until fresh result cards or a fresh "no results" state appear.
 
-        cards = page.locator(ONECHOME_SELECTORS["product_card"])
-        count = await cards.count()
-        logger.debug(f"  Found {count} commodity-item cards")
+        Returns "results", "empty", or "timeout" once ONECHOME_SEARCH_TIMEOUT
+        passes (whatever is rendered then gets parsed).
+        """
+        try:
+            handle = await page.wait_for_function(
+                _RESULTS_READY_JS,
+                arg=[ONECHOME_SELECTORS["product_card"], ONECHOME_SELECTORS["no_results"]],
+                timeout=ONECHOME_SEARCH_TIMEOUT,
+            )
+            return await handle.json_value()
+        except PlaywrightTimeoutError:
+            return "timeout"
+
+    def _record_wait(self, keyword: str, started: float, outcome: str) -> None:
+        wait = time.monotonic() - started
+        self.search_waits.append(wait)
+        logger.info(f"  Search '{keyword}' ready in {wait:.2f}s ({outcome})")
+
+    async def _run_search(
+        self, page: Page, keyword: str, trigger
+    ) -> tuple[str, list[ScrapedProduct]]:
+        """
+        Run `trigger()` (click or navigation) and wait for the search to land.
 
-        for i in range(count):
-            card = cards.nth(i)
-            try:
-                product = await self._parse_single_card(card)
-                if product:
-                    products.append(product)
-            except Exception as e:
-                logger.debug(f"  Failed to parse card {i}: {e}")
+        With XHR capture on, the search API response races the DOM readiness
+        check: products come from its JSON when it arrives first. Returns the
+        outcome ("xhr" or a `_wait_for_results` state) and the JSON products.
+        """
+        if not self._capture_xhr:
+            await trigger()
+            return await self._wait_for_results(page), []
+
+        response_task = asyncio.ensure_future(self._next_search_response(page, keyword))
+        await asyncio.sleep(0)  # listener must be registered before the request goes out
+        dom_task = None
+        try:
+            await trigger()
+            dom_task = asyncio.ensure_future(self._wait_for_results(page))
+            await asyncio.wait({response_task, dom_task}, return_when=asyncio.FIRST_COMPLETED)
+
+            response = response_task.result() if response_task.done() else None
+            if response is not None:
+                products = await self._parse_search_response(response)
+                if products:
+                    return "xhr", products
+                logger.debug("  Search XHR not usable, falling back to DOM parsing")
+
+            outcome = await dom_task
+            if response is None and outcome != "timeout":
+                # The page rendered results without a matching API response:
+                # the pattern is wrong for this site, so stop waiting on it
+                self._capture_xhr = False
+                logger.info(
+                    "No search XHR matched ONECHOME_SEARCH_API_PATTERN; "
+                    "using DOM parsing for the rest of this scrape"
+                )
+            return outcome, []
+        finally:
+            response_task.cancel()
+            if dom_task is not None:
+                dom_task.cancel()
+
+    async def _next_search_response(self, page: Page, keyword: str) -> Response | None:
+        try:
+            return await page.wait_for_event(
+                "response",
+                predicate=lambda response: _is_search_response(response, keyword),
+                timeout=ONECHOME_XHR_TIMEOUT,
+            )
+        except PlaywrightError:
+            return None
 
+    async def _parse_search_response(self, response: Response) -> list[ScrapedProduct]:
+        try:
+            payload = await response.json()
+        except (PlaywrightError, ValueError) as e:
+            logger.debug(f"  Unreadable search JSON from {response.url}: {e}")
+            return []
+
+        products = await self._run_cpu(parse_search_json, payload)
+        logger.debug(f"  Search XHR {response.url}: {len(products)} products")
         return products
 
-    async def _parse_single_card(self, card) -> ScrapedProduct | None:
-        """
-        Parse card inner text. Expected format:
-            【S＆V】クレイバースト BOX
-            JAN: 4521329346182
-            ポケモンカード
-            ※シュリンク付き、新品未開封
-            新品
-            ¥11,000
-            カートに入れる
-        """
-        text = await card.inner_text()
-        if not text.strip():
-            return None
+    async def _parse_search_results(self, page: Page) -> list[ScrapedProduct]:
+        cards = page.locator(ONECHOME_SELECTORS["product_card"])
+        # One round trip for all cards instead of count() + inner_text() per card
+        card_data = await cards.evaluate_all(
+            _EXTRACT_CARDS_JS, ONECHOME_SELECTORS["product_name"]
+        )
+        logger.debug(f"  Found {len(card_data)} commodity-item cards")
+        return await self._run_cpu(parse_cards, card_data)
 
-        lines = [line.strip() for line in text.split("\n") if line.strip()]
 
-        # Product name: first line with 【 prefix or substantial length
-        name = None
-        for line in lines:
-            if "【" in line or (len(line) > 5 and "カート" not in line and "JAN" not in line
-                               and "¥" not in line and "※" not in line):
-                name = line
-                break
+# Parsers are module-level functions of plain data so a process-pool parse
+# executor does not have to pickle the scraper.
 
-        if not name:
-            return None
 
-        # Price: ¥XX,XXX
-        price_match = re.search(ONECHOME_PRICE_PATTERN, text)
-        if not price_match:
-            return None
+def parse_search_json(payload) -> list[ScrapedProduct]:
+    for records in _iter_record_lists(payload):
+        products = [p for p in map(_parse_json_record, records) if p]
+        if products:
+            return products
+    return []
 
-        price = int(price_match.group(1).replace(",", ""))
 
-        # JAN code
-        jan_match = re.search(r"JAN[:\s]*(\d{13})", text)
-        jan_code = jan_match.group(1) if jan_match else None
+def _parse_json_record(record: dict) -> ScrapedProduct | None:
+    name = _first_field(record, "name")
+    price = _first_field(record, "price")
+    if not isinstance(name, str) or not name.strip() or price is None:
+        return None
 
-        # Condition
-        condition = "新品" if "新品" in text else ("中古" if "中古" in text else None)
+    if isinstance(price, (int, float)):
+        price = int(price)
+    else:
+        price_match = re.search(r"\d[\d,]*", str(price))
+        if not price_match:
+            return None
+        price = int(price_match.group().replace(",", ""))
+
+    jan = _first_field(record, "jan")
+    jan_code = str(jan) if jan and re.fullmatch(r"\d{13}", str(jan)) else None
+
+    raw_condition = str(_first_field(record, "condition") or "")
+    condition = "新品" if "新品" in raw_condition else (
+        "中古" if "中古" in raw_condition else None
+    )
+
+    name = name.strip()
+    return ScrapedProduct(
+        site=Site.ONECHOME,
+        name=name,
+        price_low=price,
+        jan_code=jan_code,
+        condition=condition,
+        prepared=prepare_product(name),
+    )
+
+
+def parse_cards(card_data: list[dict]) -> list[ScrapedProduct]:
+    products = []
+    for i, data in enumerate(card_data):
+        try:
+            product = _parse_single_card(data["text"], data.get("title"))
+            if product:
+                products.append(product)
+        except Exception as e:
+            logger.debug(f"  Failed to parse card {i}: {e}")
+    return products
+
+
+def _parse_single_card(text: str, title: str | None = None) -> ScrapedProduct | None:
+    """
+    Parse card inner text. Expected format:
+        【S＆V】クレイバースト BOX
+        JAN: 4521329346182
+        ポケモンカード
+        ※シュリンク付き、新品未開封
+        新品
+        ¥11,000
+        カートに入れる
+
+    `title` is the text of the card's title node, used as the name when
+    present.
+    """
+    if not text.strip():
+        return None
+
+    lines = [line.strip() for line in text.split("\n") if line.strip()]
+
+    # Product name: title node, else first line with 【 prefix or substantial length
+    name = None
+    if title and title.strip():
+        name = title.strip().split("\n")[0].strip()
+    else:
+        for line in lines:
+            if "【" in line or (len(line) > 5 and "カート" not in line and "JAN" not in line
+                               and "¥" not in line and "※" not in line):
+                name = line
+                break
 
-        return ScrapedProduct(
-            site=Site.ONECHOME,
-            name=name,
-            price_low=price,
-            jan_code=jan_code,
-            condition=condition,
-        )
+    if not name:
+        return None
+
+    # Price: ¥XX,XXX
+    price_match = re.search(ONECHOME_PRICE_PATTERN, text)
+    if not price_match:
+        return None
+
+    price = int(price_match.group(1).replace(",", ""))
+
+    # JAN code
+    jan_match = re.search(r"JAN[:\s]*(\d{13})", text)
+    jan_code = jan_match.group(1) if jan_match else None
+
+    # Condition
+    condition = "新品" if "新品" in text else ("中古" if "中古" in text else None)
+
+    return ScrapedProduct(
+        site=Site.ONECHOME,
+        name=name,
+        price_low=price,
+        jan_code=jan_code,
+        condition=condition,
+        prepared=prepare_product(name),
+    )
+
+
+def _load_search_url() -> str | None:
+    if not ONECHOME_DISCOVER_SEARCH_URL:
+        return None
+    try:
+        return Path(ONECHOME_SEARCH_URL_FILE).read_text(encoding="utf-8").strip() or None
+    except OSError:
+        return None
+
+
+def _search_url_template(url: str, keyword: str) -> str | None:
+    """`url` with the (encoded) keyword replaced by "{keyword}", or None if absent.
+
+    The keyword must be a whole path segment or query value, so a short
+    ASCII keyword cannot match inside an unrelated part of the URL.
+    """
+    parts = urlsplit(url)
+    if parts.netloc != urlsplit(ONECHOME_BASE_URL).netloc:
+        return None
+    origin = f"{parts.scheme}://{parts.netloc}"
+    rest = url[len(origin):].replace("{", "{{").replace("}", "}}")
+    for encoded in dict.fromkeys((quote(keyword, safe=""), quote_plus(keyword), quote(keyword))):
+        match = re.search(r"(?<=[=/])" + re.escape(encoded) + r"(?=$|[&#/?])", rest)
+        if match:
+            return origin + rest[:match.start()] + "{keyword}" + rest[match.end():]
+    return None
+
+
+def _is_search_response(response: Response, keyword: str) -> bool:
+    """An XHR/fetch to the search API carrying `keyword` in its URL or body."""
+    request = response.request
+    if request.resource_type not in ("xhr", "fetch"):
+        return False
+    if re.search(ONECHOME_SEARCH_API_PATTERN, response.url) is None:
+        return False
+    body = request.post_data or ""
+    return (
+        keyword in unquote_plus(response.url)
+        or keyword in body
+        or json.dumps(keyword)[1:-1] in body  # JSON body with \u escapes
+    )
+
+
+def _host_in(host: str, domains) -> bool:
+    """True if `host` is one of `domains` or a subdomain of one."""
+    return any(host == d or host.endswith("." + d) for d in domains)
+
+
+def _first_field(record: dict, field: str):
+    for key in ONECHOME_JSON_FIELDS[field]:
+        if record.get(key) not in (None, ""):
+            return record[key]
+    return None
+
+
+def _iter_record_lists(payload):
+    """Yield every list of dicts in a JSON payload, outermost first."""
+    pending = [payload]
+    while pending:
+        node = pending.pop(0)
+        if isinstance(node, dict):
+            pending.extend(node.values())
+        elif isinstance(node, list):
+            if node and all(isinstance(x, dict) for x in node):
+                yield node
+            pending.extend(node)
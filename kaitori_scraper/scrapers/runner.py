@@ -0,0 +1,118 @@
+"""
+Site scraper orchestration shared by the CLI and the web runner.
+
+Scrapers hit different hosts with independent politeness rules, so by default
+they run concurrently; a failure in one site is logged and isolated so the
+other site's results still reach compare_results. In incremental mode,
+recently recorded matches are reused instead of re-scraping those items.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+
+from kaitori_scraper.scrapers.base import BaseScraper
+from kaitori_scraper.models.data import (
+    CollectionItem, MatchResult, ProgressKind, ScrapedProduct, Site,
+)
+from kaitori_scraper.storage.price_history import PriceHistory
+from kaitori_scraper.config.settings import (
+    INCREMENTAL_TTL, INCREMENTAL_TTL_OVERRIDES, SCRAPE_CONCURRENT_SITES,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def run_scrapers(
+    scrapers: list[BaseScraper],
+    items: list[CollectionItem],
+    concurrent: bool = SCRAPE_CONCURRENT_SITES,
+    history: PriceHistory | None = None,
+) -> tuple[
+    dict[Site, list[MatchResult]], dict[Site, Exception], dict[Site, list[ScrapedProduct]]
+]:
+    """
+    Run every scraper against `items`.
+
+    With `history` (incremental mode), items whose last recorded match on a
+    site is younger than their TTL (INCREMENTAL_TTL for the site, or the
+    item's INCREMENTAL_TTL_OVERRIDES entry) are reused from it and only the
+    stale or missing items are scraped.
+
+    Returns (results, errors, products) keyed by site, results in `items`
+    order; a failed site has an entry in `errors` and only its cached
+    results. `products` holds each scraper's `scraped_products` for the
+    history store (empty when it streamed or nothing was scraped).
+    """
+    cached: dict[Site, dict[int, MatchResult]] = {}
+    jobs: list[tuple[BaseScraper, list[CollectionItem]]] = []
+    for scraper in scrapers:
+        site = scraper.site
+        cached[site] = await _recent_matches(history, items, site) if history else {}
+        stale = [item for item in items if item.id not in cached[site]]
+        if history:
+            logger.info(
+                f"{site.value}: {len(cached[site])} cached, {len(stale)} to scrape"
+            )
+        jobs.append((scraper, stale))
+
+    async def run(scraper: BaseScraper, stale: list[CollectionItem]) -> list[MatchResult]:
+        if not stale:
+            scraper._report_progress(ProgressKind.END)  # everything cached
+            return []
+        return await scraper.scrape(stale)
+
+    if concurrent:
+        outcomes = await asyncio.gather(
+            *(run(scraper, stale) for scraper, stale in jobs),
+            return_exceptions=True,
+        )
+    else:
+        outcomes = []
+        for scraper, stale in jobs:
+            try:
+                outcomes.append(await run(scraper, stale))
+            except Exception as e:
+                outcomes.append(e)
+
+    results: dict[Site, list[MatchResult]] = {}
+    errors: dict[Site, Exception] = {}
+    products: dict[Site, list[ScrapedProduct]] = {}
+    for (scraper, stale), outcome in zip(jobs, outcomes):
+        site = scraper.site
+        if isinstance(outcome, BaseException):
+            if not isinstance(outcome, Exception):
+                raise outcome  # cancellation / KeyboardInterrupt
+            logger.error(f"{site.value} scrape failed: {outcome}")
+            errors[site] = outcome
+            outcome = []
+        else:
+            products[site] = scraper.scraped_products if stale else []
+
+        by_id = {**cached[site], **{m.collection_item.id: m for m in outcome}}
+        results[site] = [by_id[item.id] for item in items if item.id in by_id]
+
+    return results, errors, products
+
+
+def _incremental_ttl(item: CollectionItem, site: Site) -> float:
+    """Seconds a recorded match of `item` on `site` stays fresh."""
+    overrides = INCREMENTAL_TTL_OVERRIDES.get(item.id, {})
+    return overrides.get(site.value, INCREMENTAL_TTL[site.value])
+
+
+async def _recent_matches(
+    history: PriceHistory, items: list[CollectionItem], site: Site
+) -> dict[int, MatchResult]:
+    """Recorded matches still fresh under each item's own TTL."""
+    ttls = {item.id: _incremental_ttl(item, site) for item in items}
+    # SQLite blocks; keep it off the (shared) event loop
+    recent = await asyncio.to_thread(
+        history.recent_matches, items, site, max(ttls.values(), default=0)
+    )
+    now = datetime.now()
+    return {
+        item_id: match
+        for item_id, match in recent.items()
+        if now - match.fetched_at <= timedelta(seconds=ttls[item_id])
+    }
@@ -0,0 +1,293 @@
+"""
+SQLite price-history store.
+
+Each run writes its scraped products and per-item matches in one
+transaction:
+
+    runs      one row per scrape run (mode, timestamps)
+    products  ScrapedProducts seen in the run (site, name, prices, JAN)
+    matches   one row per collection item x site, pointing at the matched
+              product (NULL when nothing matched)
+
+Connections are opened per call, so one PriceHistory can be shared by the
+CLI, Flask request threads and the scrape loop.
+"""
+
+import sqlite3
+from contextlib import closing
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from kaitori_scraper.models.data import (
+    CollectionItem, ComparisonRow, MatchResult, ScrapedProduct, Site,
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id           INTEGER PRIMARY KEY,
+    mode         TEXT NOT NULL,
+    started_at   TEXT NOT NULL,
+    completed_at TEXT
+);
+CREATE TABLE IF NOT EXISTS products (
+    id          INTEGER PRIMARY KEY,
+    run_id      INTEGER NOT NULL REFERENCES runs(id),
+    site        TEXT NOT NULL,
+    name        TEXT NOT NULL,
+    price_low   INTEGER NOT NULL,
+    price_high  INTEGER,
+    product_url TEXT,
+    product_id  TEXT,
+    jan_code    TEXT,
+    is_enhanced INTEGER NOT NULL DEFAULT 0,
+    condition   TEXT,
+    scraped_at  TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS matches (
+    id              INTEGER PRIMARY KEY,
+    run_id          INTEGER NOT NULL REFERENCES runs(id),
+    item_id         INTEGER NOT NULL,
+    site            TEXT NOT NULL,
+    product_row_id  INTEGER REFERENCES products(id),
+    score           REAL NOT NULL,
+    matched_keyword TEXT,
+    scraped_at      TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_products_run ON products(run_id);
+CREATE INDEX IF NOT EXISTS idx_products_site_time ON products(site, scraped_at);
+CREATE INDEX IF NOT EXISTS idx_products_jan ON products(jan_code);
+CREATE INDEX IF NOT EXISTS idx_matches_run ON matches(run_id);
+CREATE INDEX IF NOT EXISTS idx_matches_item_site_time ON matches(item_id, site, scraped_at);
+"""
+
+
+@dataclass
+class PricePoint:
+    """One matched price for a collection item on a site in one run."""
+    run_id: int
+    item_id: int
+    site: Site
+    scraped_at: datetime
+    product_name: str
+    price_low: int
+    price_high: int | None
+    score: float
+    jan_code: str | None = None
+
+
+_PRICE_POINT_SQL = """
+SELECT m.run_id, m.item_id, m.site, m.scraped_at,
+       p.name, p.price_low, p.price_high, m.score, p.jan_code
+FROM matches m JOIN products p ON p.id = m.product_row_id
+"""
+
+
+class PriceHistory:
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30.0)
+        conn.execute("PRAGMA foreign_keys = ON")
+        return conn
+
+    def save_run(
+        self,
+        rows: list[ComparisonRow],
+        mode: str,
+        started_at: datetime,
+        completed_at: datetime | None = None,
+        products: list[ScrapedProduct] | None = None,
+    ) -> int:
+        """
+        Store one run; returns its run id.
+
+        `products` is the full crawled catalog when the caller has it; matched
+        products are always stored so every match row can reference one.
+        Products are stored once per distinct value, so a matched product that
+        came back as a copy (process-pool matching) is not duplicated.
+        """
+        # Cached matches were reused from an earlier run; re-recording them
+        # would make stale prices look fresh
+        matches = [
+            match
+            for row in rows
+            for match in (row.fastbuy_match, row.onechome_match)
+            if match is not None and not match.cached
+        ]
+        unique: dict[tuple, ScrapedProduct] = {}
+        for product in [
+            *(products or ()),
+            *(m.product for m in matches if m.product is not None),
+        ]:
+            unique.setdefault(_product_key(product), product)
+        all_products = list(unique.values())
+
+        scraped_at = (completed_at or started_at).isoformat()
+
+        with closing(self._connect()) as conn, conn:
+            cur = conn.execute(
+                "INSERT INTO runs (mode, started_at, completed_at) VALUES (?, ?, ?)",
+                (mode, started_at.isoformat(), completed_at.isoformat() if completed_at else None),
+            )
+            run_id = cur.lastrowid
+
+            # The runs INSERT above holds the write lock, so ids after the
+            # current max are ours to assign for the bulk insert
+            (base_id,) = conn.execute("SELECT COALESCE(MAX(id), 0) FROM products").fetchone()
+            row_ids = {
+                _product_key(p): base_id + i for i, p in enumerate(all_products, start=1)
+            }
+            conn.executemany(
+                "INSERT INTO products (id, run_id, site, name, price_low, price_high, "
+                "product_url, product_id, jan_code, is_enhanced, condition, scraped_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (row_ids[_product_key(p)],) + _product_values(run_id, p, scraped_at)
+                    for p in all_products
+                ],
+            )
+
+            conn.executemany(
+                "INSERT INTO matches (run_id, item_id, site, product_row_id, score, "
+                "matched_keyword, scraped_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [_match_values(run_id, m, row_ids, scraped_at) for m in matches],
+            )
+
+        return run_id
+
+    def latest_prices(self, site: Site | None = None) -> list[PricePoint]:
+        """Most recent matched price per (item, site)."""
+        sql = _PRICE_POINT_SQL + """
+        WHERE m.id IN (
+            SELECT id FROM (
+                SELECT m2.id, ROW_NUMBER() OVER (
+                    PARTITION BY m2.item_id, m2.site
+                    ORDER BY m2.scraped_at DESC, m2.id DESC
+                ) AS rn
+                FROM matches m2
+                WHERE m2.product_row_id IS NOT NULL
+            ) WHERE rn = 1
+        )
+        """
+        params: tuple = ()
+        if site is not None:
+            sql += " AND m.site = ?"
+            params = (site.value,)
+        sql += " ORDER BY m.item_id, m.site"
+        return self._query(sql, params)
+
+    def price_series(self, item_id: int, site: Site | None = None) -> list[PricePoint]:
+        """Matched prices of one collection item over time, oldest first."""
+        sql = _PRICE_POINT_SQL + " WHERE m.item_id = ?"
+        params: tuple = (item_id,)
+        if site is not None:
+            sql += " AND m.site = ?"
+            params += (site.value,)
+        sql += " ORDER BY m.scraped_at, m.id"
+        return self._query(sql, params)
+
+    def recent_matches(
+        self, items: list[CollectionItem], site: Site, max_age: float
+    ) -> dict[int, MatchResult]:
+        """
+        Latest recorded match per item on `site` younger than `max_age`
+        seconds, rebuilt as cached MatchResults (including no-match results).
+        """
+        by_id = {item.id: item for item in items}
+        if not by_id or max_age <= 0:
+            return {}
+        cutoff = (datetime.now() - timedelta(seconds=max_age)).isoformat()
+        placeholders = ",".join("?" * len(by_id))
+        sql = f"""
+        SELECT m.item_id, m.score, m.matched_keyword, m.scraped_at,
+               p.name, p.price_low, p.price_high, p.product_url, p.product_id,
+               p.jan_code, p.is_enhanced, p.condition
+        FROM matches m LEFT JOIN products p ON p.id = m.product_row_id
+        WHERE m.id IN (
+            SELECT id FROM (
+                SELECT m2.id, ROW_NUMBER() OVER (
+                    PARTITION BY m2.item_id ORDER BY m2.scraped_at DESC, m2.id DESC
+                ) AS rn
+                FROM matches m2
+                WHERE m2.site = ? AND m2.scraped_at >= ?
+                  AND m2.item_id IN ({placeholders})
+            ) WHERE rn = 1
+        )
+        """
+        results = {}
+        with closing(self._connect()) as conn:
+            for (item_id, score, keyword, scraped_at, name, price_low, price_high,
+                 url, product_id, jan_code, is_enhanced, condition) in conn.execute(
+                    sql, (site.value, cutoff, *by_id)):
+                product = None
+                if name is not None:
+                    product = ScrapedProduct(
+                        site=site,
+                        name=name,
+                        price_low=price_low,
+                        price_high=price_high,
+                        product_url=url,
+                        product_id=product_id,
+                        jan_code=jan_code,
+                        is_enhanced=bool(is_enhanced),
+                        condition=condition,
+                    )
+                results[item_id] = MatchResult(
+                    collection_item=by_id[item_id],
+                    product=product,
+                    score=score,
+                    matched_keyword=keyword,
+                    site=site,
+                    fetched_at=datetime.fromisoformat(scraped_at),
+                    cached=True,
+                )
+        return results
+
+    def _query(self, sql: str, params: tuple) -> list[PricePoint]:
+        with closing(self._connect()) as conn:
+            return [
+                PricePoint(
+                    run_id=run_id,
+                    item_id=item_id,
+                    site=Site(site),
+                    scraped_at=datetime.fromisoformat(scraped_at),
+                    product_name=name,
+                    price_low=price_low,
+                    price_high=price_high,
+                    score=score,
+                    jan_code=jan_code,
+                )
+                for run_id, item_id, site, scraped_at, name, price_low, price_high, score, jan_code
+                in conn.execute(sql, params)
+            ]
+
+
+def _product_key(p: ScrapedProduct) -> tuple:
+    """Every stored field, so equal products share one row."""
+    return (
+        p.site, p.name, p.price_low, p.price_high, p.product_url,
+        p.product_id, p.jan_code, p.is_enhanced, p.condition,
+    )
+
+
+def _product_values(run_id: int, p: ScrapedProduct, scraped_at: str) -> tuple:
+    return (
+        run_id, p.site.value, p.name, p.price_low, p.price_high,
+        p.product_url, p.product_id, p.jan_code, int(p.is_enhanced),
+        p.condition, scraped_at,
+    )
+
+
+def _match_values(
+    run_id: int, m: MatchResult, row_ids: dict[tuple, int], scraped_at: str
+) -> tuple:
+    product_row_id = row_ids[_product_key(m.product)] if m.product is not None else None
+    return (
+        run_id, m.collection_item.id, m.site.value, product_row_id,
+        m.score, m.matched_keyword, scraped_at,
+    )
@@ -8,7 +8,11 @@ Usage:
 
 from web import create_app
 
-app = create_app()
+# Run directly: debug server with the reloader. Imported by a WSGI server:
+# no debug, so the scheduler always starts.
+DEBUG = __name__ == "__main__"
+
+app = create_app(debug=DEBUG)
 
 if __name__ == "__main__":
-    app.run(debug=True, host="127.0.0.1", port=5000, threaded=True)
+    app.run(debug=DEBUG, host="127.0.0.1", port=5000, threaded=True)
@@ -0,0 +1,46 @@
+"""
+Pages/second of the fastbuy parser backends over the fixture pages.
+
+Run from the repository root:
+    python -m tests.bench_fastbuy_parser [seconds per backend]
+"""
+
+import sys
+import time
+import warnings
+from pathlib import Path
+
+from bs4 import XMLParsedAsHTMLWarning
+
+from kaitori_scraper.scrapers.fastbuy_scraper import parse_page
+
+FIXTURES = Path(__file__).parent / "fixtures" / "fastbuy"
+ENCODINGS = {"category_page_shift_jis.html": "shift_jis"}
+
+
+def bench(backend: str, pages: list[tuple[bytes, str]], seconds: float) -> float:
+    parsed = 0
+    started = time.perf_counter()
+    while time.perf_counter() - started < seconds:
+        for body, encoding in pages:
+            parse_page(body, encoding, backend=backend)
+        parsed += len(pages)
+    return parsed / (time.perf_counter() - started)
+
+
+def main() -> None:
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 2.0
+    warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning)
+    pages = [
+        (path.read_bytes(), ENCODINGS.get(path.name, "utf-8"))
+        for path in sorted(FIXTURES.glob("*.html"))
+    ]
+    print(f"{len(pages)} fixture pages, {seconds:.1f}s per backend")
+    rates = {backend: bench(backend, pages, seconds) for backend in ("bs4", "lxml")}
+    for backend, rate in rates.items():
+        print(f"  {backend:5} {rate:8.1f} pages/s")
+    print(f"  lxml speedup: {rates['lxml'] / rates['bs4']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
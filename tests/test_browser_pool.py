@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+
+from kaitori_scraper.scrapers.browser_pool import BrowserManager
+
+
+class _Context:
+    def __init__(self):
+        self.pages = []
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+class _Page:
+    def __init__(self):
+        self.context = _Context()
+        self.context.pages.append(self)
+
+    def is_closed(self):
+        return self not in self.context.pages
+
+    async def close(self):
+        self.context.pages.remove(self)
+
+
+class _Browser:
+    def is_connected(self):
+        return True
+
+
+def test_lease_closes_opened_pages_when_one_fails():
+    manager = BrowserManager(max_idle_pages=4)
+    browser = _Browser()
+    opened = []
+
+    async def ensure_browser():
+        manager._browser = browser
+        return browser
+
+    async def open_page(_browser):
+        if len(opened) == 2:
+            raise RuntimeError("homepage did not load")
+        page = _Page()
+        opened.append(page)
+        await asyncio.sleep(0)
+        return page
+
+    async def check(_page):
+        return True
+
+    async def run():
+        manager._ensure_browser = ensure_browser
+        async with manager.lease(3, open_page, check):
+            pass
+
+    with pytest.raises(RuntimeError, match="homepage"):
+        asyncio.run(run())
+
+    assert len(opened) == 2
+    assert all(page.is_closed() and page.context.closed for page in opened)
+    assert manager._idle == [] and manager._active == 0
@@ -0,0 +1,48 @@
+from pathlib import Path
+
+import pytest
+
+from kaitori_scraper.scrapers.fastbuy_scraper import parse_page
+
+FIXTURES = Path(__file__).parent / "fixtures" / "fastbuy"
+
+# Fixture page -> the charset fastbuy would send in Content-Type
+PAGES = {
+    "category_page_1.html": "utf-8",
+    "category_page_xml_declaration.html": "utf-8",
+    "category_page_shift_jis.html": "shift_jis",
+}
+
+
+def _fields(products):
+    return [
+        (p.name, p.price_low, p.price_high, p.product_url, p.product_id, p.is_enhanced)
+        for p in products
+    ]
+
+
+@pytest.mark.filterwarnings("ignore::bs4.XMLParsedAsHTMLWarning")
+@pytest.mark.parametrize("name, encoding", PAGES.items())
+def test_lxml_backend_matches_bs4(name, encoding):
+    body = (FIXTURES / name).read_bytes()
+    lxml_products = parse_page(body, encoding, backend="lxml")
+    assert lxml_products
+    assert _fields(lxml_products) == _fields(parse_page(body, encoding, backend="bs4"))
+
+
+def test_parse_page_fields():
+    body = (FIXTURES / "category_page_1.html").read_bytes()
+    first, second = parse_page(body, "utf-8", backend="lxml")[:2]
+    assert _fields([first, second]) == [
+        ("変幻の仮面 BOX", 5000, None,
+         "https://fastbuy.jp/index.php/index/index/goodsdetail?id=3100", "3100", True),
+        ("クリムゾンヘイズ BOX", 5730, 6630,
+         "https://fastbuy.jp/index.php/index/index/goodsdetail?id=3101", "3101", False),
+    ]
+    assert first.prepared is not None
+
+
+@pytest.mark.parametrize("backend", ["lxml", "bs4"])
+@pytest.mark.parametrize("body", [b"", b"   ", b"<!-- empty -->", b"<html></html>"])
+def test_empty_documents(backend, body):
+    assert parse_page(body, "utf-8", backend=backend) == []
@@ -0,0 +1,131 @@
+import random
+from difflib import SequenceMatcher
+from pathlib import Path
+
+import pytest
+
+from kaitori_scraper.config.collection import COLLECTION
+from kaitori_scraper.config.settings import MATCH_THRESHOLD
+from kaitori_scraper.matcher import fuzzy_match
+from kaitori_scraper.matcher.fuzzy_match import (
+    IncrementalMatcher, _normalize, _tokenize, find_best_match, find_best_matches,
+)
+from kaitori_scraper.models.data import ScrapedProduct, Site
+from kaitori_scraper.scrapers.fastbuy_scraper import parse_page
+
+FIXTURES = Path(__file__).parent / "fixtures" / "fastbuy"
+
+_EXTRA_WORDS = [
+    "BOX", "拡張パック", "「", "」", "セット", "ナンジャモ", "シュリンク付き",
+    "未開封", "強化", "ボックス", "151", "ex",
+]
+
+
+# ── Reference: the original uncascaded matcher ──
+
+
+def _reference_score(keyword: str, product_name: str) -> float:
+    kw = _normalize(keyword)
+    pn = _normalize(product_name)
+    scores = []
+    if kw in pn:
+        scores.append(0.95)
+    if pn in kw:
+        scores.append(0.90)
+    scores.append(SequenceMatcher(None, kw, pn).ratio())
+    kw_tokens = _tokenize(keyword, filter_stopwords=True)
+    pn_tokens = _tokenize(product_name, filter_stopwords=True)
+    if kw_tokens:
+        scores.append(len(kw_tokens & pn_tokens) / len(kw_tokens))
+    return max(scores)
+
+
+def _reference_match(item, products):
+    best_score, best_product, best_keyword = 0.0, None, None
+    for keyword in item.search_keywords:
+        for product in products:
+            score = _reference_score(keyword, product.name)
+            if score > best_score:
+                best_score, best_product, best_keyword = score, product, keyword
+    if best_score < MATCH_THRESHOLD:
+        best_product = None
+    return best_score, best_product, best_keyword
+
+
+# ── Fixtures ──
+
+
+def _catalog(rnd: random.Random, size: int) -> list[ScrapedProduct]:
+    words = [w for item in COLLECTION for kw in item.search_keywords for w in kw.split()]
+    words += _EXTRA_WORDS
+    names = [item.name_jp for item in rnd.sample(COLLECTION, k=min(3, len(COLLECTION)))]
+    while len(names) < size:
+        name = " ".join(rnd.choice(words) for _ in range(rnd.randint(1, 5)))
+        names.append(name + rnd.choice(["", " BOX", "ボックス", "」"]))
+    rnd.shuffle(names)
+    # Duplicate names make ties, which must resolve to the earliest product
+    names += rnd.sample(names, k=size // 10)
+    return [
+        ScrapedProduct(site=Site.FASTBUY, name=name, price_low=1000 + i)
+        for i, name in enumerate(names)
+    ]
+
+
+def _assert_same(result, expected):
+    score, product, keyword = expected
+    assert result.score == score
+    assert result.product is product
+    assert result.matched_keyword == keyword
+
+
+# ── Tests ──
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_find_best_match_equals_full_scan(seed):
+    rnd = random.Random(seed)
+    products = _catalog(rnd, rnd.randint(0, 120))
+    for item in COLLECTION:
+        expected = _reference_match(item, products)
+        _assert_same(find_best_match(item, products, Site.FASTBUY), expected)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_incremental_matcher_equals_concatenated_catalog(seed):
+    rnd = random.Random(seed)
+    chunks = [_catalog(rnd, rnd.randint(0, 30)) for _ in range(6)]
+    catalog = [p for chunk in chunks for p in chunk]
+
+    matcher = IncrementalMatcher(COLLECTION, Site.FASTBUY, use_index=False)
+    order = list(range(len(chunks)))
+    rnd.shuffle(order)
+    for chunk in order:
+        matcher.add(chunk, chunks[chunk])
+
+    for item, result in zip(COLLECTION, matcher.results()):
+        _assert_same(result, _reference_match(item, catalog))
+
+
+@pytest.mark.parametrize("backend", ["ngram", "vector"])
+def test_streamed_pages_equal_batch_on_fastbuy_fixtures(monkeypatch, backend):
+    monkeypatch.setattr(fuzzy_match, "MATCH_BACKEND", backend)
+    pages = [
+        parse_page((FIXTURES / name).read_bytes(), encoding, backend="lxml")
+        for name, encoding in [
+            ("category_page_1.html", "utf-8"),
+            ("category_page_xml_declaration.html", "utf-8"),
+            ("category_page_shift_jis.html", "shift_jis"),
+        ]
+    ]
+    catalog = [p for page in pages for p in page]
+
+    # Pages arrive out of order, as with concurrent fetches
+    matcher = IncrementalMatcher(COLLECTION, Site.FASTBUY)
+    for chunk in [2, 0, 1]:
+        matcher.add(chunk, pages[chunk])
+
+    batch = find_best_matches(COLLECTION, catalog, Site.FASTBUY)
+    for streamed, expected in zip(matcher.results(), batch):
+        assert streamed.product is expected.product
+        assert streamed.score == expected.score
+        assert streamed.matched_keyword == expected.matched_keyword
@@ -0,0 +1,92 @@
+import asyncio
+import os
+import time
+
+import httpx
+import pytest
+
+from kaitori_scraper.scrapers import fastbuy_scraper
+from kaitori_scraper.scrapers.fastbuy_scraper import FastbuyScraper
+from kaitori_scraper.scrapers.http_cache import HttpCache
+
+URL = "https://fastbuy.jp/index/index/categorydetail?id=8"
+PAGE = "<html><body>ページ</body></html>".encode("utf-8")
+
+
+@pytest.fixture(autouse=True)
+def fast_limiter(monkeypatch):
+    monkeypatch.setattr(fastbuy_scraper, "FASTBUY_RATE_LIMIT", 1000.0)
+
+
+def _fetch_all(tmp_path, handler, max_age: float = 0.0, fetches: int = 2):
+    scraper = FastbuyScraper(use_cache=False, cache_max_age=max_age)
+    scraper.cache = HttpCache(tmp_path, max_bytes=1 << 20)
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return [await scraper._fetch_page(client, URL, "https://fastbuy.jp/") for _ in range(fetches)]
+
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize(
+    "validator, conditional",
+    [
+        ({"ETag": '"v1"'}, ("If-None-Match", '"v1"')),
+        ({"Last-Modified": "Wed, 01 Jan 2026 00:00:00 GMT"},
+         ("If-Modified-Since", "Wed, 01 Jan 2026 00:00:00 GMT")),
+    ],
+)
+def test_revalidates_with_conditional_get(tmp_path, validator, conditional):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.headers.get(conditional[0]) == conditional[1]:
+            return httpx.Response(304)
+        return httpx.Response(
+            200, content=PAGE, headers={"Content-Type": "text/html; charset=utf-8", **validator}
+        )
+
+    first, second = _fetch_all(tmp_path, handler)
+    assert first == second == (PAGE, "utf-8")
+    assert conditional[0] not in requests[0].headers
+    assert requests[1].headers[conditional[0]] == conditional[1]
+
+
+def test_reuses_entry_within_max_age(tmp_path):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, content=PAGE, headers={"ETag": '"v1"'})
+
+    assert _fetch_all(tmp_path, handler, max_age=3600, fetches=3)[-1][0] == PAGE
+    assert len(requests) == 1
+
+
+def test_revalidation_resets_age(tmp_path):
+    cache = HttpCache(tmp_path, max_bytes=1 << 20)
+    cache.put(URL, PAGE, "utf-8", etag='"v1"')
+    old = cache.get(URL)
+    time.sleep(0.01)
+    cache.touch(URL, revalidated=True)
+    assert cache.get(URL).fetched_at > old.fetched_at
+
+
+def test_evicts_least_recently_used_by_mtime(tmp_path):
+    body = b"x" * 100
+    cache = HttpCache(tmp_path, max_bytes=250)
+    urls = [f"{URL}&page={n}" for n in range(3)]
+    for age, url in zip((300, 200), urls):
+        cache.put(url, body, "utf-8")
+        body_path, _ = cache._paths(url)
+        stamp = time.time() - age
+        os.utime(body_path, (stamp, stamp))
+
+    cache.touch(urls[0])  # page 0 becomes the most recently used
+    cache.put(urls[2], body, "utf-8")
+
+    assert cache.get(urls[0]) is not None
+    assert cache.get(urls[1]) is None
+    assert cache.get(urls[2]) is not None
@@ -0,0 +1,77 @@
+import random
+
+import pytest
+
+from kaitori_scraper.config.collection import COLLECTION
+from kaitori_scraper.config.settings import MATCH_CANDIDATE_LIMIT
+from kaitori_scraper.matcher.fuzzy_match import find_best_match
+from kaitori_scraper.matcher.ngram_index import ProductIndex
+from kaitori_scraper.models.data import CollectionItem, ProductType, ScrapedProduct, Site
+
+# More near-duplicates than the candidate cut, so the cut actually bites
+CROWD = MATCH_CANDIDATE_LIMIT + 30
+
+
+def _products(names: list[str]) -> list[ScrapedProduct]:
+    return [ScrapedProduct(site=Site.FASTBUY, name=n, price_low=1000 + i) for i, n in enumerate(names)]
+
+
+def _item(*keywords: str) -> CollectionItem:
+    return CollectionItem(
+        id=999, name_jp=keywords[0], series="test", quantity=1,
+        product_type=ProductType.BOX, search_keywords=list(keywords),
+    )
+
+
+def _assert_index_matches_full_scan(item, products):
+    full = find_best_match(item, products, Site.FASTBUY)
+    indexed = find_best_match(item, products, Site.FASTBUY, index=ProductIndex(products))
+    assert (indexed.product, indexed.score, indexed.matched_keyword) == (
+        full.product, full.score, full.matched_keyword
+    )
+    return full
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_candidates_give_full_scan_best_match(seed):
+    rnd = random.Random(seed)
+    words = [w for item in COLLECTION for kw in item.search_keywords for w in kw.split()]
+    words += ["BOX", "拡張パック", "シュリンク付き", "未開封", "強化", "セット"]
+    names = [item.name_jp for item in COLLECTION]
+    names += [" ".join(rnd.choices(words, k=rnd.randint(1, 5))) for _ in range(400)]
+    rnd.shuffle(names)
+    products = _products(names)
+    for item in COLLECTION:
+        _assert_index_matches_full_scan(item, products)
+
+
+def test_exact_name_after_a_crowd_of_ties():
+    # Every crowd name contains the keyword, so all tie on n-gram hits
+    names = [f"変幻の仮面BOX限定版No.{i}" for i in range(CROWD)] + ["変幻の仮面"]
+    products = _products(names)
+    match = _assert_index_matches_full_scan(_item("変幻の仮面"), products)
+    assert match.product is products[-1] and match.score == 1.0
+
+
+def test_jan_hit_after_a_crowd_of_similar_codes():
+    jan = "4521329346182"
+    names = [f"ポケモンカード 452132934{i:04d}" for i in range(CROWD)]
+    names.append(f"クレイバースト BOX {jan}")
+    products = _products(names)
+    match = _assert_index_matches_full_scan(_item(jan), products)
+    assert match.product is products[-1]
+
+
+def test_name_contained_in_keyword_is_not_cut():
+    # "クレイバースト" shares few n-grams with the keyword but is contained in it
+    names = [f"スノーハザード ジムセット 第{i}弾" for i in range(CROWD)] + ["クレイバースト"]
+    products = _products(names)
+    match = _assert_index_matches_full_scan(
+        _item("スノーハザード クレイバースト ジムセット"), products
+    )
+    assert match.product is products[-1]
+
+
+def test_single_character_keyword_scans_everything():
+    products = _products(["変幻の仮面 BOX", "クレイバースト BOX"])
+    assert ProductIndex(products).candidates("箱") == products
@@ -0,0 +1,54 @@
+import asyncio
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+from kaitori_scraper.scrapers.onechome_scraper import OneChomeScraper
+
+
+class _Route:
+    def __init__(self, url: str, resource_type: str):
+        self.request = SimpleNamespace(url=url, resource_type=resource_type)
+        self.outcome = None
+
+    async def abort(self):
+        self.outcome = "blocked"
+
+    async def continue_(self):
+        self.outcome = "allowed"
+
+
+def _filter(scraper, url, resource_type):
+    route = _Route(url, resource_type)
+    asyncio.run(scraper._filter_request(route))
+    return route.outcome
+
+
+@pytest.mark.parametrize(
+    "url, resource_type, outcome",
+    [
+        ("https://1-chome.com/search?k=x", "document", "allowed"),
+        ("https://1-chome.com/assets/app.css", "stylesheet", "allowed"),
+        ("https://cdn.example-cdn.net/app.js", "script", "allowed"),
+        ("https://api.1chome-api.jp/goods/search", "xhr", "allowed"),
+        ("https://1-chome.com/img/card.png", "image", "blocked"),
+        ("https://fonts.gstatic.com/x.woff2", "font", "blocked"),
+        ("https://www.google-analytics.com/g/collect", "xhr", "blocked"),
+        ("https://www.googletagmanager.com/gtm.js", "script", "blocked"),
+    ],
+)
+def test_default_filter(url, resource_type, outcome):
+    assert _filter(OneChomeScraper(), url, resource_type) == outcome
+
+
+def test_third_party_hosts_logged_once(caplog):
+    scraper = OneChomeScraper()
+    with caplog.at_level(logging.DEBUG, logger="kaitori_scraper.scrapers.onechome_scraper"):
+        for _ in range(3):
+            _filter(scraper, "https://cdn.example-cdn.net/app.js", "script")
+        _filter(scraper, "https://1-chome.com/", "document")
+    assert [r.message for r in caplog.records if "Third-party" in r.message] == [
+        "Third-party host cdn.example-cdn.net (script): allowed"
+    ]
+    assert scraper.request_counts["allowed"] == 4
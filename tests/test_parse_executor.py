@@ -0,0 +1,23 @@
+import pickle
+
+import pytest
+
+from kaitori_scraper.scrapers import fastbuy_scraper, onechome_scraper
+
+
+@pytest.mark.parametrize(
+    "func",
+    [fastbuy_scraper.parse_page, onechome_scraper.parse_cards, onechome_scraper.parse_search_json],
+)
+def test_parse_functions_pickle_for_process_pool(func):
+    # A process-pool parse executor pickles the callable; it must not drag
+    # the scraper (and its HTTP client / locks) along
+    assert pickle.loads(pickle.dumps(func)) is func
+
+
+def test_onechome_parse_cards_round_trips_through_pickle():
+    cards = [{"text": "【S＆V】クレイバースト BOX\nJAN: 4521329346182\n新品\n¥11,000", "title": None}]
+    products = pickle.loads(pickle.dumps(onechome_scraper.parse_cards(cards)))
+    assert [(p.name, p.price_low, p.jan_code) for p in products] == [
+        ("【S＆V】クレイバースト BOX", 11000, "4521329346182")
+    ]
@@ -0,0 +1,81 @@
+import asyncio
+import copy
+import sqlite3
+from datetime import datetime, timedelta
+
+from kaitori_scraper.config.collection import COLLECTION
+from kaitori_scraper.models.data import ComparisonRow, MatchResult, ScrapedProduct, Site
+from kaitori_scraper.scrapers.base import BaseScraper
+from kaitori_scraper.scrapers.runner import run_scrapers
+from kaitori_scraper.storage.price_history import PriceHistory
+
+ITEM = COLLECTION[0]
+
+
+def _catalog() -> list[ScrapedProduct]:
+    return [
+        ScrapedProduct(site=Site.FASTBUY, name=ITEM.name_jp, price_low=5000, product_id="1"),
+        ScrapedProduct(site=Site.FASTBUY, name="別の商品 BOX", price_low=7000, product_id="2"),
+    ]
+
+
+class _CatalogScraper(BaseScraper):
+    site = Site.FASTBUY
+
+    async def scrape(self, items):
+        self.scraped_products = _catalog()
+        # Matching on a process pool hands back copies, not catalog objects
+        return [
+            MatchResult(item, copy.deepcopy(self.scraped_products[0]), 0.95, item.name_jp, self.site)
+            for item in items
+        ]
+
+
+def _count(db, table: str) -> int:
+    with sqlite3.connect(db) as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def test_scraped_catalog_is_stored_once(tmp_path):
+    results, errors, products = asyncio.run(run_scrapers([_CatalogScraper()], [ITEM]))
+    assert not errors
+    assert len(products[Site.FASTBUY]) == 2
+
+    db = tmp_path / "history.db"
+    history = PriceHistory(db)
+    rows = [ComparisonRow(collection_item=ITEM, fastbuy_match=results[Site.FASTBUY][0])]
+    history.save_run(
+        rows, "fastbuy", datetime(2026, 1, 1), datetime(2026, 1, 1, 0, 5),
+        products=products[Site.FASTBUY],
+    )
+
+    # The matched copy shares the row of its catalog original
+    assert _count(db, "products") == 2
+    [point] = history.latest_prices(Site.FASTBUY)
+    assert (point.item_id, point.price_low) == (ITEM.id, 5000)
+
+
+def test_incremental_ttl_overrides_per_item(tmp_path, monkeypatch):
+    from kaitori_scraper.scrapers import runner
+
+    volatile, stable = COLLECTION[0], COLLECTION[1]
+    history = PriceHistory(tmp_path / "history.db")
+    rows = [
+        ComparisonRow(collection_item=item, fastbuy_match=MatchResult(
+            item, None, 0.0, None, Site.FASTBUY))
+        for item in (volatile, stable)
+    ]
+    history.save_run(rows, "fastbuy", datetime.now() - timedelta(hours=2))
+
+    monkeypatch.setitem(runner.INCREMENTAL_TTL, "fastbuy", 6 * 3600)
+    monkeypatch.setattr(runner, "INCREMENTAL_TTL_OVERRIDES", {volatile.id: {"fastbuy": 3600}})
+
+    class _Scraper(_CatalogScraper):
+        async def scrape(self, items):
+            self.scraped = [item.id for item in items]
+            return []
+
+    scraper = _Scraper()
+    results, _, _ = asyncio.run(run_scrapers([scraper], [volatile, stable], history=history))
+    assert scraper.scraped == [volatile.id]
+    assert [m.collection_item.id for m in results[Site.FASTBUY]] == [stable.id]
@@ -0,0 +1,41 @@
+import asyncio
+
+from kaitori_scraper.scrapers.base import BaseScraper
+from kaitori_scraper.models.data import Site
+
+
+class _Scraper(BaseScraper):
+    site = Site.FASTBUY
+
+    async def scrape(self, items):
+        return []
+
+
+async def _limited_request(scraper: _Scraper):
+    limiter = scraper._rate_limiter("https://example.com/page", rate=1000.0, burst=5)
+
+    async def request():
+        async with limiter.slot():
+            await asyncio.sleep(0)
+
+    # Contend for the single slot so the semaphore actually waits on the loop
+    await asyncio.gather(*(request() for _ in range(3)))
+    return limiter
+
+
+def test_limiter_shared_within_loop():
+    async def run():
+        a = await _limited_request(_Scraper())
+        b = await _limited_request(_Scraper())
+        return a, b
+
+    a, b = asyncio.run(run())
+    assert a is b
+
+
+def test_limiter_usable_across_event_loops():
+    # Each asyncio.run creates a new loop; the limiter must not be reused
+    # across them or its lock/semaphore raise "bound to a different event loop"
+    first = asyncio.run(_limited_request(_Scraper()))
+    second = asyncio.run(_limited_request(_Scraper()))
+    assert first is not second
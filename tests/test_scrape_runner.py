@@ -0,0 +1,96 @@
+import asyncio
+import contextvars
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import pytest
+
+from kaitori_scraper.scrapers import base
+from web import scrape_runner
+from web.scrape_runner import ScrapeState, _update, wait_for_progress
+
+
+@pytest.fixture
+def jobs(monkeypatch):
+    now = datetime.now()
+    registry = {
+        job_id: ScrapeState(
+            job_id=job_id, status="running", mode="both", submitted_at=now, started_at=now
+        )
+        for job_id in (1, 2)
+    }
+    monkeypatch.setattr(scrape_runner, "_jobs", registry)
+    return registry
+
+
+def test_other_jobs_do_not_wake_subscriber(jobs):
+    timer = threading.Timer(0.05, _update, (jobs[2],), {"phase": "busy"})
+    timer.start()
+    try:
+        assert wait_for_progress(1, jobs[1].version, 0, timeout=0.3) is None
+    finally:
+        timer.cancel()
+
+
+def test_log_burst_is_one_snapshot(jobs):
+    handler = scrape_runner._LogHandler()
+    record = logging.LogRecord("x", logging.INFO, __file__, 0, "line", None, None)
+    context = contextvars.copy_context()
+    context.run(scrape_runner._current_job.set, 1)
+
+    # Emitting must not need the registry lock
+    with scrape_runner._lock:
+        emitter = threading.Thread(
+            target=context.run, args=(lambda: [handler.emit(record) for _ in range(5)],)
+        )
+        emitter.start()
+        emitter.join(timeout=1)
+        assert not emitter.is_alive()
+
+    snap = wait_for_progress(1, 0, 0, timeout=1)
+    assert snap.logs == ["line"] * 5
+    assert snap.version == jobs[1].version
+
+
+
+def test_parse_thread_logs_reach_the_job(jobs, monkeypatch):
+    class Scraper(base.BaseScraper):
+        async def scrape(self, items):
+            return []
+
+    logger = logging.getLogger("test_scrape_runner.parse")
+    handler = scrape_runner._LogHandler()
+    logger.addHandler(handler)
+    executor = ThreadPoolExecutor(1)
+    monkeypatch.setattr(base, "PARSE_EXECUTOR", "thread")
+    monkeypatch.setattr(base, "_executor", executor)
+
+    async def run():
+        scrape_runner._current_job.set(2)
+        await Scraper()._run_cpu(logger.warning, "parsed page")
+
+    try:
+        asyncio.run(run())
+    finally:
+        logger.removeHandler(handler)
+        executor.shutdown()
+    assert jobs[2].log_lines.since(0) == ["parsed page"]
+    assert not jobs[1].log_lines.since(0)
+
+
+def test_missing_job_reports_idle(jobs):
+    snap = wait_for_progress(99, -1, 0, timeout=5)
+    assert snap.status == "idle"
+
+
+def test_dashboard_renders_log_snapshot_with_matching_cursor(jobs):
+    from web import create_app
+
+    for i in range(3):
+        jobs[2].log_lines.append(f"line {i}")
+
+    html = create_app(scheduler=False).test_client().get("/").get_data(as_text=True)
+    assert 'data-cursor="2-3"' in html
+    assert "line 0\nline 1\nline 2\n" in html
@@ -0,0 +1,69 @@
+import random
+
+import pytest
+
+from kaitori_scraper.config.collection import COLLECTION
+from kaitori_scraper.config.settings import MATCH_THRESHOLD
+from kaitori_scraper.matcher.fuzzy_match import find_best_match
+from kaitori_scraper.matcher.ngram_index import ProductIndex
+from kaitori_scraper.matcher.vector_match import VectorIndex
+from kaitori_scraper.models.data import ScrapedProduct, Site
+
+_DISTRACTORS = [
+    "遊戯王 レアリティコレクション BOX", "ONE PIECE 新時代の主役", "ドラゴンボール 烈火の闘気",
+    "ポケモンカードゲーム 拡張パック", "デュエル・マスターズ 邪神と水晶", "X",
+]
+KEYWORDS = [kw for item in COLLECTION for kw in item.search_keywords]
+
+
+def _product(name: str, i: int) -> ScrapedProduct:
+    return ScrapedProduct(site=Site.FASTBUY, name=name, price_low=1000 + i)
+
+
+@pytest.fixture
+def catalog() -> list[ScrapedProduct]:
+    names = [item.name_jp for item in COLLECTION] + _DISTRACTORS
+    random.Random(3).shuffle(names)
+    return [_product(name, i) for i, name in enumerate(names)]
+
+
+def _best(item, products, index=None):
+    match = find_best_match(item, products, Site.FASTBUY, index=index)
+    return match.product, match.score, match.matched_keyword
+
+
+def test_best_matches_agree_with_ngram_index_and_full_scan(catalog):
+    vector = VectorIndex(catalog, KEYWORDS)
+    ngram = ProductIndex(catalog)
+    for item in COLLECTION:
+        expected = _best(item, catalog)
+        assert expected[1] >= MATCH_THRESHOLD
+        assert _best(item, catalog, vector) == expected
+        assert _best(item, catalog, ngram) == expected
+
+
+def test_candidates_keep_catalog_order_and_top_k(catalog):
+    vector = VectorIndex(catalog, KEYWORDS, top_k=3)
+    position = {id(p): i for i, p in enumerate(catalog)}
+    for keyword in KEYWORDS:
+        candidates = vector.candidates(keyword)
+        assert 0 < len(candidates) <= 3
+        positions = [position[id(p)] for p in candidates]
+        assert positions == sorted(positions)
+
+
+def test_empty_catalog():
+    vector = VectorIndex([], KEYWORDS)
+    assert len(vector) == 0
+    assert vector.candidates(KEYWORDS[0]) == []
+    assert find_best_match(COLLECTION[0], [], Site.FASTBUY, index=vector).product is None
+
+
+@pytest.mark.filterwarnings("error")  # NumPy division warnings would fail the test
+def test_zero_vectors_do_not_divide_by_zero(catalog):
+    # "X" has no n-grams (zero product row); "Y" is a zero keyword row
+    vector = VectorIndex(catalog, ["Y", "変幻の仮面"])
+    assert vector.candidates("Y") is catalog
+    assert all(p.name != "X" for p in vector.candidates("変幻の仮面"))
+    # Keywords the index was not built for fall back to the whole catalog
+    assert vector.candidates("未登録") is catalog
@@ -1,13 +1,24 @@
 from flask import Flask
+from werkzeug.serving import is_running_from_reloader
 
-from web.scrape_runner import init_background_loop
+from web.scrape_runner import init_background_loop, start_scheduler
 
 
-def create_app() -> Flask:
+def create_app(scheduler: bool | None = None, debug: bool | None = None) -> Flask:
+    """
+    Build the app. `scheduler=None` starts scheduled scrapes in every process
+    except the debug reloader's file watcher, which never serves requests.
+    """
     app = Flask(__name__)
     app.config["SECRET_KEY"] = "dev-key-pokecard"
+    if debug is not None:
+        app.debug = debug
 
     init_background_loop()
+    if scheduler is None:
+        scheduler = not app.debug or is_running_from_reloader()
+    if scheduler:
+        start_scheduler()
 
     from web.routes import bp
 
@@ -1,11 +1,11 @@
 """Flask route definitions."""
 
 import json
-import time
 
 from flask import (
     Blueprint,
     Response,
+    abort,
     jsonify,
     redirect,
     render_template,
@@ -14,16 +14,42 @@ from flask import (
 )
 
 from kaitori_scraper.config.collection import get_collection_by_ids
-from web.scrape_runner import get_state, start_scrape
+from kaitori_scraper.models.data import Site
+from kaitori_scraper.output.report import generate_csv_report, generate_text_report
+from web.scrape_runner import (
+    ScrapeState,
+    get_history,
+    get_job,
+    get_logs,
+    get_state,
+    latest_completed,
+    list_jobs,
+    list_schedule,
+    start_scrape,
+    wait_for_progress,
+)
 
 bp = Blueprint("main", __name__)
 
+# Seconds between SSE keepalive comments while a job is quiet
+PROGRESS_HEARTBEAT = 15.0
+
 
 @bp.route("/")
 def dashboard():
     items = get_collection_by_ids(None)
     state = get_state()
-    return render_template("dashboard.html", items=items, state=state)
+    # One snapshot: the SSE resume cursor must match the lines rendered
+    log_lines, log_seq = get_logs(state)
+    return render_template(
+        "dashboard.html",
+        items=items,
+        state=state,
+        log_lines=log_lines,
+        log_seq=log_seq,
+        jobs=list_jobs(),
+        schedule=list_schedule(),
+    )
 
 
 @bp.route("/scrape", methods=["POST"])
@@ -31,39 +57,74 @@ def scrape():
     mode = request.form.get("mode", "both")
     if mode not in ("both", "fastbuy", "onechome"):
         mode = "both"
-    start_scrape(mode)
+    start_scrape(mode, incremental=request.form.get("incremental") == "1")
     return redirect(url_for("main.dashboard"))
 
 
+def _job_or_404(job_id: int) -> ScrapeState:
+    job = get_job(job_id)
+    if job is None:
+        abort(404)
+    return job
+
+
 @bp.route("/results")
 def results():
-    state = get_state()
-    if not state.results:
+    job = latest_completed()
+    if job is None:
         return redirect(url_for("main.dashboard"))
-    return render_template("results.html", state=state)
+    return redirect(url_for("main.job_results", job_id=job.job_id))
+
+
+@bp.route("/jobs/<int:job_id>/results")
+def job_results(job_id: int):
+    job = _job_or_404(job_id)
+    if not job.results:
+        return redirect(url_for("main.dashboard"))
+    return render_template("results.html", state=job)
+
+
+def _parse_event_id(value: str | None) -> tuple[int, int]:
+    """Split a ``<job_id>-<log_seq>`` SSE event id; (0, 0) if absent."""
+    try:
+        job_id, seq = value.split("-", 1)
+        return int(job_id), int(seq)
+    except (AttributeError, ValueError):
+        return 0, 0
 
 
 @bp.route("/api/progress")
 def progress_stream():
+    # Browsers send Last-Event-ID when reconnecting; the dashboard passes the
+    # job and log cursor it rendered server-side on first connect.
+    job_id, log_seq = _parse_event_id(
+        request.headers.get("Last-Event-ID") or request.args.get("last_event_id")
+    )
+    if not job_id:
+        job_id = get_state().job_id
+
     def generate():
-        last_log_count = 0
+        nonlocal log_seq
+        version = -1
         while True:
-            state = get_state()
-            new_logs = state.log_lines[last_log_count:]
-            last_log_count = len(state.log_lines)
+            snap = wait_for_progress(job_id, version, log_seq, PROGRESS_HEARTBEAT)
+            if snap is None:
+                yield ": keepalive\n\n"
+                continue
+            version, log_seq = snap.version, snap.log_seq
             data = json.dumps(
                 {
-                    "status": state.status,
-                    "progress": round(state.progress * 100, 1),
-                    "phase": state.phase,
-                    "logs": new_logs,
+                    "job_id": job_id,
+                    "status": snap.status,
+                    "progress": round(snap.progress * 100, 1),
+                    "phase": snap.phase,
+                    "logs": snap.logs,
                 },
                 ensure_ascii=False,
             )
-            yield f"data: {data}\n\n"
-            if state.status in ("completed", "error", "idle"):
+            yield f"id: {job_id}-{log_seq}\ndata: {data}\n\n"
+            if snap.status in ("completed", "error", "idle"):
                 break
-            time.sleep(1)
 
     return Response(
         generate(),
@@ -72,40 +133,95 @@ def progress_stream():
     )
 
 
+def _job_json(job: ScrapeState) -> dict:
+    return {
+        "job_id": job.job_id,
+        "status": job.status,
+        "mode": job.mode,
+        "incremental": job.incremental,
+        "trigger": job.trigger,
+        "progress": round(job.progress * 100, 1),
+        "phase": job.phase,
+        "has_results": bool(job.results),
+        "submitted_at": job.submitted_at.isoformat() if job.submitted_at else None,
+        "completed_at": job.completed_at.isoformat() if job.completed_at else None,
+    }
+
+
 @bp.route("/api/status")
 def status():
-    state = get_state()
-    return jsonify(
-        {
-            "status": state.status,
-            "progress": round(state.progress * 100, 1),
-            "phase": state.phase,
-            "has_results": bool(state.results),
-        }
-    )
+    return jsonify(_job_json(get_state()))
 
 
-@bp.route("/download/csv")
-def download_csv():
-    state = get_state()
-    if not state.csv_content:
+@bp.route("/api/jobs")
+def jobs():
+    return jsonify([_job_json(job) for job in list_jobs()])
+
+
+def _download(job: ScrapeState | None, fmt: str) -> Response:
+    if job is None or not job.results:
         return redirect(url_for("main.dashboard"))
-    ts = state.completed_at.strftime("%Y%m%d_%H%M%S") if state.completed_at else "report"
+    ts = job.completed_at.strftime("%Y%m%d_%H%M%S") if job.completed_at else "report"
+    # Reports are rendered on demand from the rows rather than kept in memory
+    if fmt == "csv":
+        content = generate_csv_report(job.results, job.started_at).encode("utf-8-sig")
+        mimetype = "text/csv"
+    else:
+        content = generate_text_report(job.results, job.started_at).encode("utf-8")
+        mimetype = "text/plain; charset=utf-8"
     return Response(
-        state.csv_content.encode("utf-8-sig"),
-        mimetype="text/csv",
-        headers={"Content-Disposition": f"attachment; filename=price_report_{ts}.csv"},
+        content,
+        mimetype=mimetype,
+        headers={"Content-Disposition": f"attachment; filename=price_report_{ts}.{fmt}"},
     )
 
 
+@bp.route("/download/csv")
+def download_csv():
+    return _download(latest_completed(), "csv")
+
+
 @bp.route("/download/txt")
 def download_txt():
-    state = get_state()
-    if not state.text_content:
-        return redirect(url_for("main.dashboard"))
-    ts = state.completed_at.strftime("%Y%m%d_%H%M%S") if state.completed_at else "report"
-    return Response(
-        state.text_content.encode("utf-8"),
-        mimetype="text/plain; charset=utf-8",
-        headers={"Content-Disposition": f"attachment; filename=price_report_{ts}.txt"},
-    )
+    return _download(latest_completed(), "txt")
+
+
+@bp.route("/jobs/<int:job_id>/download/csv")
+def job_download_csv(job_id: int):
+    return _download(_job_or_404(job_id), "csv")
+
+
+@bp.route("/jobs/<int:job_id>/download/txt")
+def job_download_txt(job_id: int):
+    return _download(_job_or_404(job_id), "txt")
+
+
+def _price_point_json(point) -> dict:
+    return {
+        "run_id": point.run_id,
+        "item_id": point.item_id,
+        "site": point.site.value,
+        "scraped_at": point.scraped_at.isoformat(),
+        "product_name": point.product_name,
+        "price_low": point.price_low,
+        "price_high": point.price_high,
+        "score": point.score,
+        "jan_code": point.jan_code,
+    }
+
+
+def _site_arg() -> Site | None:
+    site = request.args.get("site")
+    return Site(site) if site in {s.value for s in Site} else None
+
+
+@bp.route("/api/history/latest")
+def history_latest():
+    points = get_history().latest_prices(_site_arg())
+    return jsonify([_price_point_json(p) for p in points])
+
+
+@bp.route("/api/history/<int:item_id>")
+def history_series(item_id: int):
+    points = get_history().price_series(item_id, _site_arg())
+    return jsonify([_price_point_json(p) for p in points])
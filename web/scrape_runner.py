@@ -1,23 +1,52 @@
 """
-Background scrape orchestration and state management.
-
-Runs async scrapers in a dedicated background thread with its own event loop,
-captures progress via logging, and exposes state for the Flask web frontend.
+Background scrape orchestration and job management.
+
+Runs async scrapers in a dedicated background thread with its own event loop.
+Each scrape request becomes a job: up to MAX_CONCURRENT_JOBS run at once,
+the rest wait in a FIFO queue, and the last JOB_RETENTION finished jobs keep
+their results. A scheduler on the same loop submits SCHEDULED_SCRAPES jobs
+periodically. Progress comes from the scrapers' ProgressEvents and logs are
+captured per job for the Flask web frontend.
 """
 
 import asyncio
+import atexit
 import logging
-import re
+import random
 import threading
+import time
+from collections import deque
+from contextvars import ContextVar
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
+
+import httpx
 
 from kaitori_scraper.config.collection import get_collection_by_ids
-from kaitori_scraper.scrapers.fastbuy_scraper import FastbuyScraper
+from kaitori_scraper.scrapers.fastbuy_scraper import FastbuyScraper, new_http_client
 from kaitori_scraper.scrapers.onechome_scraper import OneChomeScraper
+from kaitori_scraper.scrapers.browser_pool import BrowserManager
+from kaitori_scraper.scrapers.runner import run_scrapers
 from kaitori_scraper.output.comparator import compare_results
-from kaitori_scraper.output.report import generate_text_report, generate_csv_report
-from kaitori_scraper.models.data import ComparisonRow
+from kaitori_scraper.models.data import ComparisonRow, ProgressEvent, ProgressKind, Site
+from kaitori_scraper.storage.price_history import PriceHistory
+from kaitori_scraper.config.settings import (
+    HISTORY_DB_PATH, HISTORY_ENABLED, SCHEDULED_SCRAPES, SCHEDULE_JITTER,
+)
+
+logger = logging.getLogger(__name__)
+
+_SITE_LABELS = {Site.FASTBUY: "fastbuy.jp", Site.ONECHOME: "1-chome.com"}
+
+# Log lines kept per job; older lines are dropped from the dashboard view
+LOG_BUFFER_LINES = 2000
+# Jobs scraping at once; further submissions wait in FIFO order
+MAX_CONCURRENT_JOBS = 2
+# Finished jobs kept for results and downloads; older ones are forgotten
+JOB_RETENTION = 20
+# Seconds a progress subscriber lets changes accumulate after waking, so a
+# burst of log lines goes out as one SSE event
+PROGRESS_COALESCE = 0.1
 
 # ── Background event loop ──
 
@@ -30,156 +59,427 @@ def init_background_loop() -> None:
     _loop = asyncio.new_event_loop()
     _thread = threading.Thread(target=_loop.run_forever, daemon=True)
     _thread.start()
+    _install_log_handler()
+
+
+# ── Warm resources (shared by every job on the loop) ──
+
+_http_client: httpx.AsyncClient | None = None
+_browser_manager = BrowserManager()
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Connection-pooled client reused across jobs; only used on the loop thread."""
+    global _http_client
+    if _http_client is None:
+        _http_client = new_http_client()
+    return _http_client
+
+
+def _make_scraper(site: Site, tracker: "_ProgressTracker"):
+    if site is Site.FASTBUY:
+        return FastbuyScraper(on_progress=tracker, client=_get_http_client())
+    return OneChomeScraper(on_progress=tracker, browser_manager=_browser_manager)
+
+
+@atexit.register
+def _close_browser() -> None:
+    if _loop is not None and _loop.is_running():
+        future = asyncio.run_coroutine_threadsafe(_browser_manager.close(), _loop)
+        try:
+            future.result(timeout=5)
+        except Exception:
+            pass
+
+
+# ── Price history ──
+
+_history: PriceHistory | None = None
+
+
+def get_history() -> PriceHistory:
+    global _history
+    if _history is None:
+        _history = PriceHistory(HISTORY_DB_PATH)
+    return _history
 
 
 # ── Shared state ──
 
-_lock = threading.Lock()
-_state: "ScrapeState | None" = None
+# Guards the job registry (_jobs, _pending); re-entrant so helpers that take
+# it can call each other. Each job's fields are guarded by its own `changed`
+# condition, which is notified on every change so SSE streams never poll.
+# Lock order: _lock before a job's condition, never the reverse.
+_lock = threading.RLock()
+
+_jobs: dict[int, "ScrapeState"] = {}  # submission order
+_pending: deque[int] = deque()
+_next_job_id = 1
+
+# Job whose task is running; routes log records to that job's buffer
+_current_job: ContextVar[int | None] = ContextVar("current_job", default=None)
+
+
+class LogBuffer:
+    """Fixed-capacity log ring buffer with monotonically increasing sequence numbers.
+
+    Line ``n`` of a job has sequence ``n`` (1-based); ``last_seq`` is the
+    cursor a reader passes back to ``since`` to get only newer lines.
+    """
+
+    def __init__(self, capacity: int = LOG_BUFFER_LINES) -> None:
+        self._lines: deque[str] = deque(maxlen=capacity)
+        self.last_seq = 0
+
+    def append(self, line: str) -> int:
+        self._lines.append(line)
+        self.last_seq += 1
+        return self.last_seq
+
+    def since(self, seq: int) -> list[str]:
+        """Lines after ``seq``, or all retained lines if ``seq`` was evicted."""
+        missing = self.last_seq - seq
+        if missing <= 0:
+            return []
+        if missing >= len(self._lines):
+            return list(self._lines)
+        return list(self._lines)[-missing:]
+
+    def __len__(self) -> int:
+        return len(self._lines)
 
 
 @dataclass
 class ScrapeState:
-    status: str = "idle"  # idle | running | completed | error
+    job_id: int = 0
+    status: str = "idle"  # idle | queued | running | completed | error
     mode: str = ""
+    incremental: bool = False
+    trigger: str = "manual"  # manual | schedule
     progress: float = 0.0
     phase: str = ""
-    log_lines: list[str] = field(default_factory=list)
+    log_lines: LogBuffer = field(default_factory=LogBuffer)
+    submitted_at: datetime | None = None
     started_at: datetime | None = None
     completed_at: datetime | None = None
     results: list[ComparisonRow] = field(default_factory=list)
     error_message: str | None = None
-    csv_content: str | None = None
-    text_content: str | None = None
-    total_items: int = 18
+    # Bumped on every change to this job, under `changed`
+    version: int = 0
+    changed: threading.Condition = field(
+        default_factory=threading.Condition, repr=False, compare=False
+    )
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("completed", "error")
+
+
+@dataclass
+class ProgressSnapshot:
+    """What one SSE event carries: job state plus the log lines a subscriber lacks."""
+
+    version: int
+    job_id: int
+    log_seq: int
+    status: str
+    progress: float
+    phase: str
+    logs: list[str]
+
+
+def get_job(job_id: int) -> ScrapeState | None:
+    with _lock:
+        return _jobs.get(job_id)
+
+
+def get_logs(job: ScrapeState) -> tuple[list[str], int]:
+    """Retained log lines of ``job`` and the sequence of the last one, read together."""
+    with job.changed:
+        return job.log_lines.since(0), job.log_lines.last_seq
+
+
+def list_jobs() -> list[ScrapeState]:
+    """Retained jobs, newest first."""
+    with _lock:
+        return list(reversed(_jobs.values()))
 
 
 def get_state() -> ScrapeState:
-    global _state
+    """The job the dashboard follows: newest running job, else newest job."""
     with _lock:
-        if _state is None:
-            _state = ScrapeState()
-        return _state
+        jobs = list_jobs()
+        for job in jobs:
+            if job.status == "running":
+                return job
+        return jobs[0] if jobs else ScrapeState()
 
 
-def _update(**kwargs) -> None:
+def latest_completed() -> ScrapeState | None:
     with _lock:
-        state = get_state()
+        return next((job for job in list_jobs() if job.status == "completed"), None)
+
+
+def _notify(job: ScrapeState) -> None:
+    """Publish a change of ``job`` to its subscribers. Caller holds ``job.changed``."""
+    job.version += 1
+    job.changed.notify_all()
+
+
+def _update(job: ScrapeState, **kwargs) -> None:
+    with job.changed:
         for k, v in kwargs.items():
-            setattr(state, k, v)
+            setattr(job, k, v)
+        _notify(job)
+
+
+def wait_for_progress(
+    job_id: int, version: int, log_seq: int, timeout: float
+) -> ProgressSnapshot | None:
+    """Block until job ``job_id`` moves past ``version``, then snapshot it.
+
+    Only changes to this job wake the caller. Log lines after ``log_seq`` are
+    included. A job that no longer exists reports status "idle". Returns None
+    if nothing changed within ``timeout`` seconds so the caller can send a
+    keepalive.
+    """
+    job = get_job(job_id)
+    if job is None:
+        return ProgressSnapshot(version, job_id, log_seq, "idle", 0.0, "", [])
+
+    with job.changed:
+        if not job.changed.wait_for(lambda: job.version > version, timeout):
+            return None
+        coalesce = not job.finished
+    if coalesce:
+        time.sleep(PROGRESS_COALESCE)
+
+    with job.changed:
+        return ProgressSnapshot(
+            version=job.version,
+            job_id=job_id,
+            log_seq=job.log_lines.last_seq,
+            status=job.status,
+            progress=job.progress,
+            phase=job.phase,
+            logs=job.log_lines.since(log_seq),
+        )
 
 
 # ── Progress capture ──
 
-class _ProgressHandler(logging.Handler):
-    """Intercept scraper log messages to update progress state."""
+class _LogHandler(logging.Handler):
+    """Append scraper log lines to the buffer of the job that emitted them.
+
+    Takes only that job's lock; subscribers are asleep in their coalescing
+    window most of the time, so most notifications wake nobody.
+    """
 
     def emit(self, record: logging.LogRecord) -> None:
+        job_id = _current_job.get()
+        if job_id is None:
+            return
+        job = _jobs.get(job_id)  # atomic dict read; the registry lock isn't needed
+        if job is None:
+            return
         msg = self.format(record)
-        with _lock:
-            state = get_state()
-            state.log_lines.append(msg)
-
-            # Parse fastbuy page progress: "Crawling page 3/7"
-            m = re.search(r"Crawling page (\d+)/(\d+)", msg)
-            if m:
-                page, total = int(m.group(1)), int(m.group(2))
-                if state.mode == "fastbuy":
-                    state.progress = page / total * 0.9
-                elif state.mode == "both":
-                    state.progress = 0.3 * (page / total)
-
-            # Parse 1-chome item progress: "[5]"
-            m = re.search(r"\[(\d+)\]", msg)
-            if m and "1-chome" in state.phase:
-                item_num = int(m.group(1))
-                frac = item_num / state.total_items
-                if state.mode == "onechome":
-                    state.progress = frac * 0.9
-                elif state.mode == "both":
-                    state.progress = 0.3 + 0.65 * frac
+        with job.changed:
+            job.log_lines.append(msg)
+            _notify(job)
 
 
-# ── Async scrape orchestration ──
-
-async def _run_scrape(mode: str) -> None:
-    handler = _ProgressHandler()
+def _install_log_handler() -> None:
+    handler = _LogHandler()
     handler.setFormatter(logging.Formatter("%(asctime)s %(message)s", "%H:%M:%S"))
-
-    loggers = [
-        logging.getLogger(name) for name in (
-            "kaitori_scraper.scrapers.fastbuy_scraper",
-            "kaitori_scraper.scrapers.onechome_scraper",
-        )
-    ]
-    for lg in loggers:
-        lg.addHandler(handler)
+    for name in (
+        "kaitori_scraper.scrapers.fastbuy_scraper",
+        "kaitori_scraper.scrapers.onechome_scraper",
+        "kaitori_scraper.scrapers.runner",
+    ):
+        lg = logging.getLogger(name)
+        if not any(isinstance(h, _LogHandler) for h in lg.handlers):
+            lg.addHandler(handler)
         lg.setLevel(logging.INFO)
 
+
+class _ProgressTracker:
+    """Turn scraper ProgressEvents into a job's overall bar and phase text.
+
+    Each site contributes an equal share; within a site progress is the
+    done/total of the units it reports (pages for fastbuy, items for 1-chome).
+    """
+
+    def __init__(self, job: ScrapeState, sites: list[Site]) -> None:
+        self.job = job
+        self.fractions = {site: 0.0 for site in sites}
+
+    def __call__(self, event: ProgressEvent) -> None:
+        if event.kind is ProgressKind.ADVANCE and event.total:
+            self.fractions[event.site] = event.done / event.total
+        elif event.kind is ProgressKind.END:
+            self.fractions[event.site] = 1.0
+        else:
+            return
+
+        overall = sum(self.fractions.values()) / len(self.fractions)
+        phase = "Scraping " + " + ".join(
+            f"{_SITE_LABELS[site]} {frac:.0%}" for site, frac in self.fractions.items()
+        ) + "..."
+        with self.job.changed:
+            # Sites report concurrently: never move the bar backwards
+            self.job.progress = max(self.job.progress, 0.95 * overall)
+            self.job.phase = phase
+            _notify(self.job)
+
+
+# ── Async scrape orchestration ──
+
+async def _run_scrape(job: ScrapeState) -> None:
+    _current_job.set(job.job_id)
     try:
         items = get_collection_by_ids(None)
-        _update(total_items=len(items))
-        timestamp = datetime.now()
-        fastbuy_results = []
-        onechome_results = []
-
-        if mode in ("fastbuy", "both"):
-            _update(phase="Scraping fastbuy.jp...")
-            scraper = FastbuyScraper()
-            fastbuy_results = await scraper.scrape(items)
-            if mode == "fastbuy":
-                _update(progress=0.9)
-            else:
-                _update(progress=0.3)
-
-        if mode in ("onechome", "both"):
-            _update(phase="Scraping 1-chome.com...")
-            scraper = OneChomeScraper()
-            onechome_results = await scraper.scrape(items)
-            _update(progress=0.95)
-
-        _update(phase="Comparing results...")
+        timestamp = job.started_at
+
+        sites = []
+        if job.mode in ("fastbuy", "both"):
+            sites.append(Site.FASTBUY)
+        if job.mode in ("onechome", "both"):
+            sites.append(Site.ONECHOME)
+        tracker = _ProgressTracker(job, sites)
+        scrapers = [_make_scraper(site, tracker) for site in sites]
+
+        _update(job, phase="Scraping " + " + ".join(_SITE_LABELS[site] for site in sites) + "...")
+        history = get_history() if job.incremental else None
+        results, errors, products = await run_scrapers(scrapers, items, history=history)
+        if len(errors) == len(scrapers):
+            raise next(iter(errors.values()))
+        _update(job, progress=0.95)
+
+        fastbuy_results = results.get(Site.FASTBUY, [])
+        onechome_results = results.get(Site.ONECHOME, [])
+
+        _update(job, phase="Comparing results...")
         comparison = compare_results(items, fastbuy_results, onechome_results)
 
-        text_content = generate_text_report(comparison, timestamp)
-        csv_content = generate_csv_report(comparison, timestamp)
+        phase = "Complete"
+        if errors:
+            phase += " (failed: " + ", ".join(_SITE_LABELS[site] for site in errors) + ")"
+
+        completed_at = datetime.now()
+        if HISTORY_ENABLED:
+            await asyncio.to_thread(
+                get_history().save_run,
+                comparison,
+                job.mode,
+                timestamp,
+                completed_at,
+                [p for site_products in products.values() for p in site_products],
+            )
 
         _update(
+            job,
             status="completed",
             progress=1.0,
-            phase="Complete",
-            completed_at=datetime.now(),
+            phase=phase,
+            completed_at=completed_at,
             results=comparison,
-            csv_content=csv_content,
-            text_content=text_content,
         )
 
     except Exception as e:
         _update(
+            job,
             status="error",
             phase=f"Error: {e}",
             error_message=str(e),
+            completed_at=datetime.now(),
         )
 
     finally:
-        for lg in loggers:
-            lg.removeHandler(handler)
+        _finish()
+
 
+def _dispatch() -> None:
+    """Start queued jobs while below MAX_CONCURRENT_JOBS. Caller holds ``_lock``."""
+    running = sum(job.status == "running" for job in _jobs.values())
+    while _pending and running < MAX_CONCURRENT_JOBS:
+        job = _jobs[_pending.popleft()]
+        _update(job, status="running", phase="Initializing...", started_at=datetime.now())
+        running += 1
+        asyncio.run_coroutine_threadsafe(_run_scrape(job), _loop)
 
-def start_scrape(mode: str) -> bool:
-    """Start a background scrape. Returns False if already running."""
-    state = get_state()
-    if state.status == "running":
-        return False
 
-    global _state
+def _finish() -> None:
+    """Drop finished jobs beyond JOB_RETENTION and start the next queued ones."""
     with _lock:
-        _state = ScrapeState(
-            status="running",
+        finished = [job_id for job_id, job in _jobs.items() if job.finished]
+        for job_id in finished[:-JOB_RETENTION or None]:
+            job = _jobs.pop(job_id)
+            # Wake anyone still following it; they will find it gone
+            with job.changed:
+                _notify(job)
+        _dispatch()
+
+
+def start_scrape(
+    mode: str, incremental: bool = False, trigger: str = "manual"
+) -> ScrapeState:
+    """Submit a scrape job; it starts now or waits for a free slot."""
+    global _next_job_id
+    with _lock:
+        job = ScrapeState(
+            job_id=_next_job_id,
+            status="queued",
             mode=mode,
-            phase="Initializing...",
-            started_at=datetime.now(),
+            incremental=incremental,
+            trigger=trigger,
+            phase="Queued",
+            submitted_at=datetime.now(),
         )
+        _next_job_id += 1
+        _jobs[job.job_id] = job
+        _pending.append(job.job_id)
+        _dispatch()
+        return job
+
+
+# ── Scheduler ──
+
+@dataclass
+class ScheduleEntry:
+    mode: str
+    interval: float  # seconds
+    incremental: bool = False
+    next_run: datetime | None = None
+    last_job_id: int | None = None
+    skipped: int = 0
+
+
+_schedule: list[ScheduleEntry] = []
+
+
+def list_schedule() -> list[ScheduleEntry]:
+    return list(_schedule)
+
+
+def start_scheduler(entries: list[dict] = SCHEDULED_SCRAPES) -> None:
+    """Run each configured entry periodically on the background loop."""
+    for conf in entries:
+        entry = ScheduleEntry(**conf)
+        _schedule.append(entry)
+        asyncio.run_coroutine_threadsafe(_schedule_loop(entry), _loop)
+
+
+async def _schedule_loop(entry: ScheduleEntry) -> None:
+    while True:
+        wait = entry.interval * random.uniform(1 - SCHEDULE_JITTER, 1 + SCHEDULE_JITTER)
+        entry.next_run = datetime.now() + timedelta(seconds=wait)
+        await asyncio.sleep(wait)
 
-    asyncio.run_coroutine_threadsafe(_run_scrape(mode), _loop)
-    return True
+        last = get_job(entry.last_job_id) if entry.last_job_id else None
+        if last is not None and not last.finished:
+            entry.skipped += 1
+            logger.info(
+                f"Scheduled {entry.mode} scrape skipped: job #{last.job_id} still {last.status}"
+            )
+            continue
+        entry.last_job_id = start_scrape(entry.mode, entry.incremental, trigger="schedule").job_id